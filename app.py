@@ -7,14 +7,16 @@ safety system, multiple control strategies, and performance scoring.
 
 from __future__ import annotations
 
-from typing import Dict, List
+from collections import deque
+from typing import Deque, Dict, Mapping, Tuple
 
 import streamlit as st
 
-from src.models import Plant, PlantState, STEADY_STATE
+from src.models import Plant, STATE_FIELDS
+from src.models.history import HistoryBuffer
 from src.models.plant import cap_moves
 from src.safety import evaluate_safety, SafetyResult
-from src.controllers import NNController, MPCController
+from src.controllers import Controller, NNController, MPCController
 from src.scoring import ScoreTracker
 from src.ui.sidebar import render_sidebar
 from src.ui.dashboard import render_dashboard
@@ -24,55 +26,61 @@ from src.ui.trends import render_trends, render_score_trend
 from src.ui.event_log import render_event_log
 
 
+# Events kept in the session log; older entries are dropped as new ones arrive.
+EVENT_LOG_MAXLEN = 500
+
+
 # ---------------------------------------------------------------------------
 # Session state initialization
 # ---------------------------------------------------------------------------
 
 def _init_session() -> None:
     """Set up session state on first load."""
-    if "plant" not in st.session_state:
-        st.session_state.plant = Plant()
-    if "turn" not in st.session_state:
-        st.session_state.turn = 0
-    if "scorer" not in st.session_state:
-        st.session_state.scorer = ScoreTracker()
-    if "event_log" not in st.session_state:
-        st.session_state.event_log: List[Dict[str, str]] = []
-    if "state_history" not in st.session_state:
-        st.session_state.state_history: List[Dict[str, float]] = []
-    if "score_history" not in st.session_state:
-        st.session_state.score_history: List[float] = []
-
-
-def _log_event(turn: int, severity: str, message: str) -> None:
-    st.session_state.event_log.append(
-        {"turn": str(turn), "severity": severity, "message": message}
-    )
-
-
-def _record_state(state: PlantState) -> None:
-    st.session_state.state_history.append(state.to_dict())
+    ss = st.session_state
+    if "plant" not in ss:
+        ss.plant = Plant()
+    if "turn" not in ss:
+        ss.turn = 0
+    if "scorer" not in ss:
+        ss.scorer = ScoreTracker()
+    if "event_log" not in ss:
+        ss.event_log: Deque[Dict[str, str]] = deque(maxlen=EVENT_LOG_MAXLEN)
+    if "state_history" not in ss:
+        ss.state_history = HistoryBuffer(len(STATE_FIELDS))
+    if "score_history" not in ss:
+        ss.score_history = HistoryBuffer()
+    if "controllers" not in ss:
+        ss.controllers: Dict[str, Controller] = {}
+
+
+def _log_event(
+    log: Deque[Dict[str, str]], turn: int, severity: str, message: str
+) -> None:
+    log.append({"turn": str(turn), "severity": severity, "message": message})
 
 
 # ---------------------------------------------------------------------------
 # Simulation step
 # ---------------------------------------------------------------------------
 
-def _execute_turn(
+def _simulate_turn(
+    plant: Plant,
     u_raw: Dict[str, float],
-    scenario: Dict[str, float],
-    source: str,
-) -> SafetyResult:
-    """Execute one simulation turn with safety evaluation.
+    scenario: Mapping[str, float],
+) -> Tuple[Dict[str, float], SafetyResult]:
+    """Advance the plant by one turn without touching session state.
+
+    Not a pure function: it commits the new state to ``plant`` (or drives
+    it to the ESD safe state), so callers get a mutated plant back.
 
     Implements the two-phase commit pattern:
       1. Compute tentative next state
       2. Evaluate safety
       3. Commit (or ESD / interlock override)
-    """
-    plant: Plant = st.session_state.plant
-    turn: int = st.session_state.turn + 1
 
+    Returns:
+        (u_capped, safety) - the rate-limited inputs and the safety outcome.
+    """
     # Rate-limit control moves
     u_capped = cap_moves(u_raw, plant.state)
 
@@ -85,21 +93,44 @@ def _execute_turn(
     # Phase 3: commit
     if safety.esd_triggered:
         plant.esd_safe_state()
-        _log_event(turn, "esd", safety.esd_reason)
     elif safety.interlock_active:
-        # Recalculate with adjusted inputs
-        x_adjusted = plant.step(safety.adjusted_inputs, scenario)
-        plant.commit(x_adjusted)
-        _log_event(turn, "interlock", safety.interlock_reason)
+        # Recalculate with adjusted inputs; at the reboil floor and reflux
+        # ceiling the adjustment is a no-op and x_next already applies.
+        adjusted = safety.adjusted_inputs
+        plant.commit(x_next if adjusted == u_capped else plant.step(adjusted, scenario))
     else:
         plant.commit(x_next)
 
+    return u_capped, safety
+
+
+def _execute_turn(
+    u_raw: Dict[str, float],
+    scenario: Mapping[str, float],
+    source: str,
+) -> SafetyResult:
+    """Execute one simulation turn, then log, score, and record it."""
+    # Bind session entries once; each st.session_state read goes through
+    # Streamlit's proxy.
+    ss = st.session_state
+    plant: Plant = ss.plant
+    log = ss.event_log
+    turn: int = ss.turn + 1
+
+    u_capped, safety = _simulate_turn(plant, u_raw, scenario)
+
+    if safety.esd_triggered:
+        _log_event(log, turn, "esd", safety.esd_reason)
+    elif safety.interlock_active:
+        _log_event(log, turn, "interlock", safety.interlock_reason)
+
     # Log alarms
     for alarm in safety.alarms:
-        _log_event(turn, "alarm", alarm)
+        _log_event(log, turn, "alarm", alarm)
 
     # Log operator action
     _log_event(
+        log,
         turn,
         "action",
         f"{source}: Ref={u_capped['SP_F_Reflux']:.1f} "
@@ -108,10 +139,17 @@ def _execute_turn(
     )
 
     # Score and record
-    score = st.session_state.scorer.score_turn(turn, plant.state, safety)
-    st.session_state.score_history.append(score.total)
-    _record_state(plant.state)
-    st.session_state.turn = turn
+    state = plant.state
+    score = ss.scorer.score_turn(turn, state, safety)
+    ss.score_history.append(score.total)
+    ss.state_history.append(state.to_tuple())
+    ss.turn = turn
+
+    # When x_next was committed unchanged, the schematic status for this
+    # turn is exactly this result; seed it so main() need not re-evaluate.
+    if not (safety.esd_triggered or safety.interlock_active):
+        ss.status_safety = safety
+        ss.status_turn = turn
 
     return safety
 
@@ -128,6 +166,7 @@ def main() -> None:
     )
 
     _init_session()
+    ss = st.session_state
 
     # Title
     st.markdown(
@@ -138,8 +177,8 @@ def main() -> None:
     # Sidebar: scenario + controller selection
     scenario_dict, controller_name = render_sidebar()
 
-    plant: Plant = st.session_state.plant
-    scorer: ScoreTracker = st.session_state.scorer
+    plant: Plant = ss.plant
+    scorer: ScoreTracker = ss.scorer
     state = plant.state
 
     # KPI dashboard
@@ -153,10 +192,12 @@ def main() -> None:
     # Process action
     if action != "none":
         if action == "controller" and controller_name != "None (Manual)":
-            if controller_name == "NN Policy":
-                ctrl = NNController()
-            else:
-                ctrl = MPCController()
+            # Controllers are stateless across turns; build each once per session.
+            controllers = ss.controllers
+            ctrl = controllers.get(controller_name)
+            if ctrl is None:
+                ctrl = NNController() if controller_name == "NN Policy" else MPCController()
+                controllers[controller_name] = ctrl
             u = ctrl.decide(state, scenario_dict)
             source = f"Auto ({ctrl.name})"
         elif action == "next":
@@ -175,7 +216,7 @@ def main() -> None:
         state = plant.state  # refresh after commit
 
         # Show turn result
-        turn = st.session_state.turn
+        turn = ss.turn
         score = scorer.history[-1] if scorer.history else None
 
         if safety.esd_triggered:
@@ -198,16 +239,21 @@ def main() -> None:
 
     st.divider()
 
-    # Process schematic
-    last_safety = (
-        evaluate_safety(state, {
-            "SP_F_Reflux": state.F_Reflux,
-            "SP_F_Reboil": state.F_Reboil,
-            "SP_F_ToTol": state.F_ToTol,
-        })
-        if st.session_state.turn > 0
-        else SafetyResult()
-    )
+    # Process schematic. The plant only changes when a turn executes, so
+    # no-op reruns (widget tweaks) reuse the status evaluated for this turn.
+    turn = ss.turn
+    if ss.get("status_turn") != turn:
+        ss.status_safety = (
+            evaluate_safety(state, {
+                "SP_F_Reflux": state.F_Reflux,
+                "SP_F_Reboil": state.F_Reboil,
+                "SP_F_ToTol": state.F_ToTol,
+            })
+            if turn > 0
+            else SafetyResult()
+        )
+        ss.status_turn = turn
+    last_safety = ss.status_safety
     render_schematic(
         state,
         alarms=last_safety.alarms,
@@ -221,11 +267,11 @@ def main() -> None:
     col_left, col_right = st.columns([3, 2])
 
     with col_left:
-        render_trends(st.session_state.state_history)
-        render_score_trend(st.session_state.score_history)
+        render_trends(ss.state_history.data)
+        render_score_trend(ss.score_history.data)
 
     with col_right:
-        render_event_log(st.session_state.event_log)
+        render_event_log(ss.event_log)
 
         # Summary stats
         if scorer.history:
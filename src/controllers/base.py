@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Dict, Mapping
 
 from src.models.plant_state import PlantState
 
@@ -15,7 +15,7 @@ class Controller(ABC):
     def decide(
         self,
         state: PlantState,
-        scenario: Dict[str, float],
+        scenario: Mapping[str, float],
     ) -> Dict[str, float]:
         """Compute control action given current state and scenario.
 
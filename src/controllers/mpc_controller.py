@@ -6,7 +6,7 @@ differential pressure targets. Uses CVXPY for quadratic programming.
 
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, Mapping
 
 import numpy as np
 
@@ -37,18 +37,22 @@ class MPCController(Controller):
     R = np.diag([0.0, 0.0])       # Control effort
     S = np.diag([1.0, 1.0])       # Move suppression
 
+    # Output reference and (reflux, reboil) bounds, fixed at import
+    REF = np.array([LIMITS.xB_spec, 0.10])
+    U_LO = np.array([ACTUATOR_RANGES["SP_F_Reflux"][0], ACTUATOR_RANGES["SP_F_Reboil"][0]])
+    U_HI = np.array([ACTUATOR_RANGES["SP_F_Reflux"][1], ACTUATOR_RANGES["SP_F_Reboil"][1]])
+    DU_MAX = np.array([MOVE_CAPS["SP_F_Reflux"], MOVE_CAPS["SP_F_Reboil"]])
+
+    def __init__(self):
+        # Built on first use; only parameter values change between calls.
+        self._prob = None
+
     @property
     def name(self) -> str:
         return "Linear MPC"
 
-    def decide(
-        self,
-        state: PlantState,
-        scenario: Dict[str, float],
-    ) -> Dict[str, float]:
-        if not _HAVE_CVXPY:
-            return self._fallback(state)
-
+    def _build_problem(self) -> None:
+        """Assemble the QP once, with the measured state as parameters."""
         N = self.HORIZON
         nx, nu = 2, 2
 
@@ -56,20 +60,17 @@ class MPCController(Controller):
         x = cp.Variable((nx, N + 1))
         u = cp.Variable((nu, N))
 
-        # References and initial conditions
-        x0 = np.array([state.xB_sd, state.dP_col])
-        ref = np.array([LIMITS.xB_spec, 0.10])
-
-        # Control bounds
-        u_lo = np.array([ACTUATOR_RANGES["SP_F_Reflux"][0], ACTUATOR_RANGES["SP_F_Reboil"][0]])
-        u_hi = np.array([ACTUATOR_RANGES["SP_F_Reflux"][1], ACTUATOR_RANGES["SP_F_Reboil"][1]])
-        du_max = np.array([MOVE_CAPS["SP_F_Reflux"], MOVE_CAPS["SP_F_Reboil"]])
+        # Initial conditions and current actuator values, set per call
+        x0 = cp.Parameter(nx)
+        u_prev = cp.Parameter(nu)
+        ref, u_lo, u_hi, du_max = self.REF, self.U_LO, self.U_HI, self.DU_MAX
 
-        # Current actuator values as initial u
-        u_prev = np.array([state.F_Reflux, state.F_Reboil])
+        # First move as its own variable keeps u_prev out of quad_form, so
+        # the problem stays DPP and cvxpy reuses its canonicalization.
+        du0 = cp.Variable(nu)
 
         cost = 0.0
-        constraints = [x[:, 0] == x0]
+        constraints = [x[:, 0] == x0, du0 == u[:, 0] - u_prev]
 
         for k in range(N):
             y_k = self.C @ x[:, k]
@@ -77,7 +78,7 @@ class MPCController(Controller):
             cost += cp.quad_form(u[:, k], self.R)
 
             if k == 0:
-                cost += cp.quad_form(u[:, k] - u_prev, self.S)
+                cost += cp.quad_form(du0, self.S)
             else:
                 cost += cp.quad_form(u[:, k] - u[:, k - 1], self.S)
 
@@ -89,8 +90,8 @@ class MPCController(Controller):
 
             if k == 0:
                 constraints += [
-                    u[:, k] - u_prev <= du_max,
-                    u[:, k] - u_prev >= -du_max,
+                    du0 <= du_max,
+                    du0 >= -du_max,
                 ]
             else:
                 constraints += [
@@ -98,7 +99,25 @@ class MPCController(Controller):
                     u[:, k] - u[:, k - 1] >= -du_max,
                 ]
 
-        prob = cp.Problem(cp.Minimize(cost), constraints)
+        self._prob = cp.Problem(cp.Minimize(cost), constraints)
+        self._x0 = x0
+        self._u_prev = u_prev
+        self._u = u
+
+    def decide(
+        self,
+        state: PlantState,
+        scenario: Mapping[str, float],
+    ) -> Dict[str, float]:
+        if not _HAVE_CVXPY:
+            return self._fallback(state)
+
+        if self._prob is None:
+            self._build_problem()
+        self._x0.value = np.array([state.xB_sd, state.dP_col])
+        self._u_prev.value = np.array([state.F_Reflux, state.F_Reboil])
+
+        prob, u = self._prob, self._u
         try:
             prob.solve(solver=cp.OSQP, warm_start=True, verbose=False)
             if prob.status in ("optimal", "optimal_inaccurate"):
@@ -118,8 +137,10 @@ class MPCController(Controller):
     def _fallback(self, state: PlantState) -> Dict[str, float]:
         """Simple proportional fallback if CVXPY is unavailable."""
         xB_err = LIMITS.xB_spec - state.xB_sd
+        rr_lo, rr_hi = ACTUATOR_RANGES["SP_F_Reflux"]
+        qr_lo, qr_hi = ACTUATOR_RANGES["SP_F_Reboil"]
         return {
-            "SP_F_Reflux": float(np.clip(state.F_Reflux + 3.0 * xB_err, *ACTUATOR_RANGES["SP_F_Reflux"])),
-            "SP_F_Reboil": float(np.clip(state.F_Reboil + 1.5 * xB_err, *ACTUATOR_RANGES["SP_F_Reboil"])),
+            "SP_F_Reflux": min(max(state.F_Reflux + 3.0 * xB_err, rr_lo), rr_hi),
+            "SP_F_Reboil": min(max(state.F_Reboil + 1.5 * xB_err, qr_lo), qr_hi),
             "SP_F_ToTol": state.F_ToTol,
         }
@@ -7,9 +7,7 @@ while respecting column pressure constraints.
 
 from __future__ import annotations
 
-from typing import Dict
-
-import numpy as np
+from typing import Dict, Mapping
 
 from src.controllers.base import Controller
 from src.models.constants import LIMITS, ACTUATOR_RANGES
@@ -26,7 +24,7 @@ class NNController(Controller):
     def decide(
         self,
         state: PlantState,
-        scenario: Dict[str, float],
+        scenario: Mapping[str, float],
     ) -> Dict[str, float]:
         xB_target = LIMITS.xB_spec
         dP_limit = LIMITS.dP_alarm
@@ -37,17 +35,17 @@ class NNController(Controller):
         # Reflux: increase for purity, decrease for pressure
         reflux = state.F_Reflux + 5.0 * xB_err - 3.0 * dP_excess
         rr_lo, rr_hi = ACTUATOR_RANGES["SP_F_Reflux"]
-        reflux = float(np.clip(reflux, rr_lo, rr_hi))
+        reflux = min(max(reflux, rr_lo), rr_hi)
 
         # Reboiler: increase for purity, decrease for pressure
         reboil = state.F_Reboil + 2.0 * xB_err - 1.0 * dP_excess
         qr_lo, qr_hi = ACTUATOR_RANGES["SP_F_Reboil"]
-        reboil = float(np.clip(reboil, qr_lo, qr_hi))
+        reboil = min(max(reboil, qr_lo), qr_hi)
 
         # Toluene transfer: maintain current flow
         totol = state.F_ToTol
         tt_lo, tt_hi = ACTUATOR_RANGES["SP_F_ToTol"]
-        totol = float(np.clip(totol, tt_lo, tt_hi))
+        totol = min(max(totol, tt_lo), tt_hi)
 
         return {
             "SP_F_Reflux": reflux,
@@ -1,5 +1,5 @@
 from src.models.constants import LIMITS, STEADY_STATE, MOVE_CAPS, ACTUATOR_RANGES
-from src.models.plant_state import PlantState
+from src.models.plant_state import PlantState, STATE_FIELDS, STATE_COLUMNS
 from src.models.plant import Plant
 
-__all__ = ["LIMITS", "STEADY_STATE", "MOVE_CAPS", "ACTUATOR_RANGES", "PlantState", "Plant"]
+__all__ = ["LIMITS", "STEADY_STATE", "MOVE_CAPS", "ACTUATOR_RANGES", "PlantState", "STATE_FIELDS", "STATE_COLUMNS", "Plant"]
@@ -0,0 +1,38 @@
+"""Append-only numeric history buffers for session trends."""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+
+
+class HistoryBuffer:
+    """Contiguous float64 history with amortised O(1) appends.
+
+    Rows live in one preallocated array that doubles in capacity when
+    full, so trend rendering reads a zero-copy slice rather than
+    rebuilding arrays from a list of records.
+    """
+
+    def __init__(self, width: int | None = None, capacity: int = 256):
+        shape = (capacity,) if width is None else (capacity, width)
+        self._data = np.empty(shape, dtype=np.float64)
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def append(self, row: float | Sequence[float]) -> None:
+        """Append one value (1-D buffer) or one row (2-D buffer)."""
+        if self._len == len(self._data):
+            grown = np.empty((max(1, 2 * len(self._data)),) + self._data.shape[1:])
+            grown[: self._len] = self._data
+            self._data = grown
+        self._data[self._len] = row
+        self._len += 1
+
+    @property
+    def data(self) -> np.ndarray:
+        """View of the recorded rows; valid until the next append."""
+        return self._data[: self._len]
@@ -7,8 +7,7 @@ commit() applies it.
 
 from __future__ import annotations
 
-import math
-from typing import Dict
+from typing import Dict, Mapping, Tuple
 
 import numpy as np
 
@@ -24,6 +23,11 @@ class Plant:
     TAU_REBOIL = 0.5
     TAU_TRANSFER = 0.25
 
+    # Per-turn lag gains 1 / (1 + tau), folded once at class creation
+    GAIN_REFLUX = 1.0 / (1.0 + TAU_REFLUX)
+    GAIN_REBOIL = 1.0 / (1.0 + TAU_REBOIL)
+    GAIN_TRANSFER = 1.0 / (1.0 + TAU_TRANSFER)
+
     def __init__(self, initial_state: Dict[str, float] | None = None):
         state = initial_state or dict(STEADY_STATE)
         self._state = PlantState.from_dict(state)
@@ -32,7 +36,7 @@ class Plant:
     def state(self) -> PlantState:
         return self._state
 
-    def step(self, u: Dict[str, float], scenario: Dict[str, float]) -> PlantState:
+    def step(self, u: Dict[str, float], scenario: Mapping[str, float]) -> PlantState:
         """Compute tentative next state without modifying internal state.
 
         Args:
@@ -43,8 +47,65 @@ class Plant:
         Returns:
             Tentative PlantState for safety evaluation.
         """
-        x = self._state.to_dict()
-        return PlantState.from_dict(self._physics(x, u, scenario))
+        return self._physics(self._state, u, scenario)
+
+    def step_batch(
+        self, u: Dict[str, np.ndarray], scenario: Mapping[str, float]
+    ) -> np.ndarray:
+        """Compute tentative next states for N candidate inputs at once.
+
+        Applies the same model as step() element-wise, for what-if
+        exploration of many setpoints from the current state.
+
+        Args:
+            u: Control inputs keyed like step(), each an array of shape (N,).
+            scenario: Operating conditions shared by every candidate.
+
+        Returns:
+            Array of shape (N, 8), columns in PlantState field order.
+        """
+        return self.physics_batch(self._state.to_array(), u, scenario)
+
+    @classmethod
+    def physics_batch(
+        cls,
+        states: np.ndarray,
+        u: Dict[str, np.ndarray],
+        scenario: Mapping[str, np.ndarray | float],
+    ) -> np.ndarray:
+        """Advance N independent rollouts one turn with array arithmetic.
+
+        Args:
+            states: (N, 8) array in STATE_FIELDS order, or one (8,) state
+                    shared by every row.
+            u: Control inputs keyed like step(), scalars or (N,) arrays.
+            scenario: Operating conditions keyed like step(), scalars or
+                      (N,) arrays for per-rollout conditions.
+
+        Returns:
+            Array of shape (N, 8), columns in PlantState field order.
+        """
+        sp_ref = np.asarray(u["SP_F_Reflux"], dtype=float)
+        sp_reb = np.asarray(u["SP_F_Reboil"], dtype=float)
+        sp_tot = np.asarray(u["SP_F_ToTol"], dtype=float)
+        x_next = cls._advance(
+            np.atleast_2d(states).T, sp_ref, sp_reb, sp_tot, scenario, np.clip
+        )
+        return np.column_stack(np.broadcast_arrays(*x_next))
+
+    def rollout(
+        self, u: Dict[str, float], scenario: Mapping[str, float], n_steps: int
+    ) -> PlantState:
+        """Hold fixed inputs for n_steps turns and commit the final state.
+
+        Equivalent to n_steps step()/commit() pairs with no safety checks
+        in between, for offline soak tests of the model.
+        """
+        x = self._state
+        for _ in range(n_steps):
+            x = self._physics(x, u, scenario)
+        self._state = x
+        return x
 
     def commit(self, x_next: PlantState) -> None:
         """Accept a tentative state as the new plant state."""
@@ -52,85 +113,105 @@ class Plant:
 
     def esd_safe_state(self) -> PlantState:
         """Compute and commit a conservative emergency safe state."""
-        x = self._state.to_dict()
-        safe = {
-            "xB_sd": max(x["xB_sd"] - 0.002, 0.90),
-            "dP_col": min(x["dP_col"], 0.25),
-            "T_top": x["T_top"] - 5.0,
-            "L_Drum": min(max(x["L_Drum"], 0.30), 0.70),
-            "L_Bot": min(max(x["L_Bot"], 0.30), 0.70),
-            "F_Reflux": 20.0,
-            "F_Reboil": 0.5,
-            "F_ToTol": 45.0,
-        }
-        self._state = PlantState.from_dict(safe)
+        x = self._state
+        self._state = PlantState(
+            xB_sd=max(x.xB_sd - 0.002, 0.90),
+            dP_col=min(x.dP_col, 0.25),
+            T_top=x.T_top - 5.0,
+            L_Drum=min(max(x.L_Drum, 0.30), 0.70),
+            L_Bot=min(max(x.L_Bot, 0.30), 0.70),
+            F_Reflux=20.0,
+            F_Reboil=0.5,
+            F_ToTol=45.0,
+        )
         return self._state
 
     def _physics(
-        self, x: Dict[str, float], u: Dict[str, float], sc: Dict[str, float]
-    ) -> Dict[str, float]:
+        self, x: PlantState, u: Dict[str, float], sc: Mapping[str, float]
+    ) -> PlantState:
         """First-order dynamic model of the benzene column."""
+        x_next = self._advance(
+            x.to_tuple(), u["SP_F_Reflux"], u["SP_F_Reboil"], u["SP_F_ToTol"], sc, _clamp
+        )
+        return PlantState(*x_next)
+
+    @classmethod
+    def _advance(cls, x, sp_ref, sp_reb, sp_tot, sc, clip) -> Tuple:
+        """Model equations shared by the scalar and batch paths.
+
+        Written once so step() and physics_batch() cannot drift apart.
+        Operands are floats (with clip=_clamp) or NumPy arrays (with
+        clip=np.clip); x holds the current values in STATE_FIELDS order.
+
+        Returns:
+            Next values in STATE_FIELDS order.
+        """
+        xB0, dP0, T_top0, L_Drum0, L_Bot0, F_Ref0, F_Reb0, F_ToT0 = x
         F_feed = sc.get("F_feed", 80.0)
-        zB = sc.get("zB_feed", 0.60)
         foul_c = sc.get("Fouling_Cond", 0.0)
         foul_r = sc.get("Fouling_Reb", 0.0)
 
         # --- Actuator dynamics: first-order lag toward setpoints ---
-        F_Ref = x["F_Reflux"] + (u["SP_F_Reflux"] - x["F_Reflux"]) / (1.0 + self.TAU_REFLUX)
-        F_Reb = x["F_Reboil"] + (u["SP_F_Reboil"] - x["F_Reboil"]) / (1.0 + self.TAU_REBOIL)
-        F_ToT = x["F_ToTol"] + (u["SP_F_ToTol"] - x["F_ToTol"]) / (1.0 + self.TAU_TRANSFER)
+        F_Ref = F_Ref0 + (sp_ref - F_Ref0) * cls.GAIN_REFLUX
+        F_Reb = F_Reb0 + (sp_reb - F_Reb0) * cls.GAIN_REBOIL
+        F_ToT = F_ToT0 + (sp_tot - F_ToT0) * cls.GAIN_TRANSFER
+
+        # Deviations from the nominal operating point, shared by all balances
+        ref_dev = F_Ref - 25.0
+        reb_dev = F_Reb - 1.2
+        tot_dev = F_ToT - 55.0
 
         # --- Level dynamics: mass-balance driven ---
         feed_norm = F_feed / 80.0
         drum_delta = (
-            0.02 * (F_Ref - 25.0) / 10.0
+            0.02 * ref_dev / 10.0
             - 0.015 * feed_norm
-            + 0.01 * (F_ToT - 55.0) / 20.0
+            + 0.01 * tot_dev / 20.0
         )
-        L_Drum = np.clip(x["L_Drum"] + drum_delta, 0.0, 1.0)
+        L_Drum = clip(L_Drum0 + drum_delta, 0.0, 1.0)
 
         bot_delta = (
             0.015 * feed_norm
-            - 0.02 * (F_ToT - 55.0) / 20.0
-            - 0.005 * (F_Reb - 1.2)
+            - 0.02 * tot_dev / 20.0
+            - 0.005 * reb_dev
         )
-        L_Bot = np.clip(x["L_Bot"] + bot_delta, 0.0, 1.0)
+        L_Bot = clip(L_Bot0 + bot_delta, 0.0, 1.0)
 
         # --- Quality (benzene purity): separation energy balance ---
         separation_energy = (
-            0.003 * (F_Ref - 25.0) / 10.0
-            + 0.004 * (F_Reb - 1.2)
+            0.003 * ref_dev / 10.0
+            + 0.004 * reb_dev
             - 0.002 * (feed_norm - 1.0)
             - 0.002 * foul_r
             - 0.001 * foul_c
         )
-        xB = np.clip(x["xB_sd"] + separation_energy, 0.80, 1.0)
+        xB = clip(xB0 + separation_energy, 0.80, 1.0)
 
         # --- Column differential pressure: vapor traffic + fouling ---
         dP_base = 0.08
-        vapor_traffic = 0.05 * (F_Reb - 1.2) + 0.03 * (F_Ref - 25.0) / 10.0
+        vapor_traffic = 0.05 * reb_dev + 0.03 * ref_dev / 10.0
         fouling_effect = 0.08 * (foul_c + foul_r)
-        dP = np.clip(
-            x["dP_col"] + 0.3 * (dP_base + vapor_traffic + fouling_effect - x["dP_col"]),
-            0.0,
-            0.5,
-        )
+        dP = clip(dP0 + 0.3 * (dP_base + vapor_traffic + fouling_effect - dP0), 0.0, 0.5)
 
         # --- Overhead temperature: VLE correlation ---
         T_vle = 80.1 + 21.0 * (1.0 - xB) ** 0.85
         fouling_T_bias = 2.0 * foul_c
-        T_top = x["T_top"] + 0.4 * (T_vle + fouling_T_bias - x["T_top"])
+        T_top = T_top0 + 0.4 * (T_vle + fouling_T_bias - T_top0)
+
+        return xB, dP, T_top, L_Drum, L_Bot, F_Ref, F_Reb, F_ToT
+
+
+def _clamp(v: float, lo: float, hi: float) -> float:
+    """Scalar counterpart of np.clip for the shared model equations."""
+    return min(max(v, lo), hi)
+
 
-        return {
-            "xB_sd": float(xB),
-            "dP_col": float(dP),
-            "T_top": float(T_top),
-            "L_Drum": float(L_Drum),
-            "L_Bot": float(L_Bot),
-            "F_Reflux": float(F_Ref),
-            "F_Reboil": float(F_Reb),
-            "F_ToTol": float(F_ToT),
-        }
+# (setpoint key, process-variable attribute, per-turn cap), fixed at import
+_MOVE_LIMITS = (
+    ("SP_F_Reflux", "F_Reflux", MOVE_CAPS["SP_F_Reflux"]),
+    ("SP_F_Reboil", "F_Reboil", MOVE_CAPS["SP_F_Reboil"]),
+    ("SP_F_ToTol", "F_ToTol", MOVE_CAPS["SP_F_ToTol"]),
+)
 
 
 def cap_moves(
@@ -140,16 +221,10 @@ def cap_moves(
 
     Prevents dangerous step changes that real actuators cannot achieve.
     """
-    x = current_state.to_dict()
-    mapping = {
-        "SP_F_Reflux": "F_Reflux",
-        "SP_F_Reboil": "F_Reboil",
-        "SP_F_ToTol": "F_ToTol",
-    }
     capped = {}
-    for sp_key, pv_key in mapping.items():
-        current = x[pv_key]
-        requested = u_requested[sp_key]
-        cap = MOVE_CAPS[sp_key]
-        capped[sp_key] = float(np.clip(requested, current - cap, current + cap))
+    for sp_key, pv_key, cap in _MOVE_LIMITS:
+        current = getattr(current_state, pv_key)
+        lo, hi = current - cap, current + cap
+        v = u_requested[sp_key]
+        capped[sp_key] = lo if v < lo else hi if v > hi else v
     return capped
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict, fields
-from typing import Dict
+from dataclasses import dataclass, fields
+from typing import Dict, Sequence, Tuple
 
+import numpy as np
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class PlantState:
     """Snapshot of the benzene column plant state.
 
@@ -23,9 +25,37 @@ class PlantState:
     F_ToTol: float    # Toluene transfer (t/h)
 
     def to_dict(self) -> Dict[str, float]:
-        return asdict(self)
+        return dict(zip(STATE_FIELDS, self.to_tuple()))
+
+    def to_tuple(self) -> Tuple[float, ...]:
+        """Field values in STATE_FIELDS order."""
+        return (
+            self.xB_sd,
+            self.dP_col,
+            self.T_top,
+            self.L_Drum,
+            self.L_Bot,
+            self.F_Reflux,
+            self.F_Reboil,
+            self.F_ToTol,
+        )
+
+    def to_array(self) -> np.ndarray:
+        """Field values as a float64 vector in STATE_FIELDS order."""
+        return np.array(self.to_tuple())
 
     @classmethod
     def from_dict(cls, d: Dict[str, float]) -> PlantState:
-        valid_keys = {f.name for f in fields(cls)}
-        return cls(**{k: v for k, v in d.items() if k in valid_keys})
+        return cls(**{k: d[k] for k in STATE_FIELDS if k in d})
+
+    @classmethod
+    def from_array(cls, a: Sequence[float]) -> PlantState:
+        """Inverse of to_array(); also accepts a step_batch() row."""
+        return cls(*map(float, a))
+
+
+# Field names in declaration order; the column layout of to_tuple() rows.
+STATE_FIELDS: Tuple[str, ...] = tuple(f.name for f in fields(PlantState))
+
+# Column index of each field in (N, 8) state arrays (step_batch, history).
+STATE_COLUMNS: Dict[str, int] = {name: i for i, name in enumerate(STATE_FIELDS)}
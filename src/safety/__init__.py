@@ -1,3 +1,17 @@
-from src.safety.safety_system import SafetyResult, evaluate_safety
+from src.safety.safety_system import (
+    AlarmCode,
+    SafetyBatchResult,
+    SafetyResult,
+    dp_tier,
+    evaluate_safety,
+    evaluate_safety_batch,
+)
 
-__all__ = ["SafetyResult", "evaluate_safety"]
+__all__ = [
+    "AlarmCode",
+    "SafetyBatchResult",
+    "SafetyResult",
+    "dp_tier",
+    "evaluate_safety",
+    "evaluate_safety_batch",
+]
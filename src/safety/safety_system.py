@@ -8,10 +8,67 @@ Tier 3 - ESD:         Emergency shutdown for critical conditions.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from enum import IntFlag
 from typing import Dict, List
 
+import numpy as np
+
 from src.models.constants import LIMITS
-from src.models.plant_state import PlantState
+from src.models.plant_state import STATE_COLUMNS, PlantState
+
+
+class AlarmCode(IntFlag):
+    """Tier-1 alarm bits, one per alarm table row, as set in alarm_mask."""
+
+    HIGH_DP = 1 << 0
+    HIGH_T_TOP = 1 << 1
+    OFF_SPEC_XB = 1 << 2
+    LOW_DRUM = 1 << 3
+    LOW_BOTTOMS = 1 << 4
+
+
+# Tier-1 alarm table as parallel columns. A sign of +1 alarms above the
+# limit, -1 alarms below it: sign * value > sign * limit.
+_ALARM_FIELDS = ("dP_col", "T_top", "xB_sd", "L_Drum", "L_Bot")
+_ALARM_LIMITS = (
+    LIMITS.dP_alarm,
+    LIMITS.T_top_alarm,
+    LIMITS.xB_spec,
+    LIMITS.L_drum_alarm,
+    LIMITS.L_bot_alarm,
+)
+_ALARM_SIGNS = (1.0, 1.0, -1.0, -1.0, -1.0)
+_ALARM_FORMATS = (
+    "HIGH dP: {:.3f} bar",
+    "HIGH T_top: {:.1f} C",
+    "OFF-SPEC xB: {:.4f}",
+    "LOW drum level: {:.3f}",
+    "LOW bottoms level: {:.3f}",
+)
+
+# Remaining thresholds read on the hot path, unpacked into locals per call.
+_DP_LEVELS = (LIMITS.dP_alarm, LIMITS.dP_interlock, LIMITS.dP_esd)
+_ESD_LIMITS = (LIMITS.T_top_esd, LIMITS.L_drum_esd)
+
+# The evaluate_safety fast path and dp_tier both rely on every alarm
+# threshold sitting strictly inside its interlock/ESD counterpart. Fail
+# loudly at import if SafetyLimits is retuned in a way that breaks this.
+if not (
+    LIMITS.dP_alarm < LIMITS.dP_interlock < LIMITS.dP_esd
+    and LIMITS.T_top_alarm < LIMITS.T_top_esd
+    and LIMITS.L_drum_esd < LIMITS.L_drum_alarm
+):
+    raise ValueError(
+        "SafetyLimits must order alarm < interlock < ESD thresholds "
+        "(dP, T_top) and ESD < alarm (L_drum)"
+    )
+
+# Vector forms of the alarm table for batch evaluation over (N, 8) state
+# arrays laid out in PlantState field order (as returned by step_batch).
+_ALARM_COLS = np.array([STATE_COLUMNS[name] for name in _ALARM_FIELDS])
+_ALARM_SIGN_VEC = np.array(_ALARM_SIGNS)
+_ALARM_SIGNED_LIMITS = _ALARM_SIGN_VEC * np.array(_ALARM_LIMITS)
+_ALARM_BITS = 1 << np.arange(len(_ALARM_FIELDS))
 
 
 @dataclass
@@ -19,17 +76,41 @@ class SafetyResult:
     """Outcome of a safety evaluation."""
 
     alarms: List[str] = field(default_factory=list)
+    alarm_mask: int = 0  # AlarmCode bits of the tripped tier-1 alarms
     interlock_active: bool = False
     interlock_reason: str = ""
     adjusted_inputs: Dict[str, float] = field(default_factory=dict)
     esd_triggered: bool = False
     esd_reason: str = ""
 
+    @property
+    def alarm_codes(self) -> AlarmCode:
+        return AlarmCode(self.alarm_mask)
+
     @property
     def is_clear(self) -> bool:
         return not self.alarms and not self.interlock_active and not self.esd_triggered
 
 
+@dataclass
+class SafetyBatchResult:
+    """Per-row outcome of a batch safety evaluation."""
+
+    alarm_mask: np.ndarray        # int, same bit layout as SafetyResult.alarm_mask
+    interlock_active: np.ndarray  # bool
+    esd_triggered: np.ndarray     # bool
+
+
+def dp_tier(dP_col: float) -> int:
+    """Classify column dP into 0 (normal), 1 (alarm), 2 (interlock), 3 (ESD).
+
+    The thresholds are strictly ordered, so summing the three comparisons
+    gives the tier index without a branch cascade.
+    """
+    alarm, interlock, esd = _DP_LEVELS
+    return (dP_col > alarm) + (dP_col > interlock) + (dP_col > esd)
+
+
 def evaluate_safety(
     x_next: PlantState, u_applied: Dict[str, float]
 ) -> SafetyResult:
@@ -42,29 +123,47 @@ def evaluate_safety(
     Returns:
         SafetyResult with alarms, interlock adjustments, or ESD flag.
     """
+    # Read each monitored variable once, in alarm-table column order.
+    values = (x_next.dP_col, x_next.T_top, x_next.xB_sd, x_next.L_Drum, x_next.L_Bot)
+    dP, T_top, xB, L_drum, L_bot = values
+    dP_A, T_top_A, xB_spec, L_drum_A, L_bot_A = _ALARM_LIMITS
+
+    # --- Fast path: every alarm threshold sits inside its interlock/ESD
+    # counterpart, so a state that raises no alarm cannot trip anything else.
+    if (
+        dP <= dP_A
+        and T_top <= T_top_A
+        and xB >= xB_spec
+        and L_drum >= L_drum_A
+        and L_bot >= L_bot_A
+    ):
+        return SafetyResult()
+
     result = SafetyResult()
+    dP_level = dp_tier(dP)
+    T_top_E, L_drum_E = _ESD_LIMITS
 
     # --- Tier 3: Emergency Shutdown (checked first - highest priority) ---
-    if x_next.dP_col > LIMITS.dP_esd:
+    if dP_level == 3:
         result.esd_triggered = True
-        result.esd_reason = f"Critical column dP: {x_next.dP_col:.3f} bar > {LIMITS.dP_esd} bar"
+        result.esd_reason = f"Critical column dP: {dP:.3f} bar > {LIMITS.dP_esd} bar"
         return result
 
-    if x_next.T_top > LIMITS.T_top_esd:
+    if T_top > T_top_E:
         result.esd_triggered = True
-        result.esd_reason = f"Critical overhead T: {x_next.T_top:.1f} C > {LIMITS.T_top_esd} C"
+        result.esd_reason = f"Critical overhead T: {T_top:.1f} C > {LIMITS.T_top_esd} C"
         return result
 
-    if x_next.L_Drum < LIMITS.L_drum_esd:
+    if L_drum < L_drum_E:
         result.esd_triggered = True
-        result.esd_reason = f"Critical drum level: {x_next.L_Drum:.3f} < {LIMITS.L_drum_esd}"
+        result.esd_reason = f"Critical drum level: {L_drum:.3f} < {LIMITS.L_drum_esd}"
         return result
 
     # --- Tier 2: Interlocks ---
-    if x_next.dP_col > LIMITS.dP_interlock:
+    if dP_level >= 2:
         result.interlock_active = True
         result.interlock_reason = (
-            f"Flooding interlock: dP {x_next.dP_col:.3f} bar > {LIMITS.dP_interlock} bar"
+            f"Flooding interlock: dP {dP:.3f} bar > {LIMITS.dP_interlock} bar"
         )
         adjusted = dict(u_applied)
         adjusted["SP_F_Reboil"] = max(u_applied["SP_F_Reboil"] - 0.2, 0.3)
@@ -72,19 +171,40 @@ def evaluate_safety(
         result.adjusted_inputs = adjusted
 
     # --- Tier 1: Alarms ---
-    if x_next.dP_col > LIMITS.dP_alarm:
-        result.alarms.append(f"HIGH dP: {x_next.dP_col:.3f} bar")
+    mask = 0
+    for bit, (value, limit, sign) in enumerate(zip(values, _ALARM_LIMITS, _ALARM_SIGNS)):
+        mask |= (sign * value > sign * limit) << bit
+    result.alarm_mask = mask
+    result.alarms = [
+        fmt.format(value)
+        for bit, (value, fmt) in enumerate(zip(values, _ALARM_FORMATS))
+        if mask >> bit & 1
+    ]
 
-    if x_next.T_top > LIMITS.T_top_alarm:
-        result.alarms.append(f"HIGH T_top: {x_next.T_top:.1f} C")
+    return result
 
-    if x_next.xB_sd < LIMITS.xB_spec:
-        result.alarms.append(f"OFF-SPEC xB: {x_next.xB_sd:.4f}")
 
-    if x_next.L_Drum < LIMITS.L_drum_alarm:
-        result.alarms.append(f"LOW drum level: {x_next.L_Drum:.3f}")
+def evaluate_safety_batch(states: np.ndarray) -> SafetyBatchResult:
+    """Evaluate the safety tiers for N tentative states at once.
 
-    if x_next.L_Bot < LIMITS.L_bot_alarm:
-        result.alarms.append(f"LOW bottoms level: {x_next.L_Bot:.3f}")
+    Mirrors evaluate_safety row by row: ESD rows report no interlock and
+    no alarms, since the scalar path returns before reaching them.
 
-    return result
+    Args:
+        states: Array of shape (N, 8), columns in PlantState field order.
+    """
+    states = np.atleast_2d(states)
+    dP = states[:, STATE_COLUMNS["dP_col"]]
+    T_top_E, L_drum_E = _ESD_LIMITS
+    esd = (
+        (dP > LIMITS.dP_esd)
+        | (states[:, STATE_COLUMNS["T_top"]] > T_top_E)
+        | (states[:, STATE_COLUMNS["L_Drum"]] < L_drum_E)
+    )
+    tripped = states[:, _ALARM_COLS] * _ALARM_SIGN_VEC > _ALARM_SIGNED_LIMITS
+    mask = tripped @ _ALARM_BITS
+    return SafetyBatchResult(
+        alarm_mask=np.where(esd, 0, mask),
+        interlock_active=(dP > LIMITS.dP_interlock) & ~esd,
+        esd_triggered=esd,
+    )
@@ -1,3 +1,3 @@
-from src.scenarios.library import Scenario, SCENARIO_LIBRARY, get_scenario
+from src.scenarios.library import Scenario, SCENARIO_LIBRARY, SCENARIO_NAMES, get_scenario
 
-__all__ = ["Scenario", "SCENARIO_LIBRARY", "get_scenario"]
+__all__ = ["Scenario", "SCENARIO_LIBRARY", "SCENARIO_NAMES", "get_scenario"]
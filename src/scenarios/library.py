@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Scenario:
     """A training scenario with operating conditions and metadata."""
 
@@ -18,13 +20,21 @@ class Scenario:
     Fouling_Cond: float
     Fouling_Reb: float
 
-    def to_dict(self) -> Dict[str, float]:
-        return {
-            "F_feed": self.F_feed,
-            "zB_feed": self.zB_feed,
-            "Fouling_Cond": self.Fouling_Cond,
-            "Fouling_Reb": self.Fouling_Reb,
-        }
+    def to_dict(self) -> Mapping[str, float]:
+        """Operating conditions as a read-only mapping, built once per scenario."""
+        return _conditions(self)
+
+
+@lru_cache(maxsize=None)
+def _conditions(s: Scenario) -> Mapping[str, float]:
+    # Scenario is frozen (hashable) and the view is read-only, so every
+    # caller can safely share the one mapping.
+    return MappingProxyType({
+        "F_feed": s.F_feed,
+        "zB_feed": s.zB_feed,
+        "Fouling_Cond": s.Fouling_Cond,
+        "Fouling_Reb": s.Fouling_Reb,
+    })
 
 
 SCENARIO_LIBRARY = [
@@ -103,9 +113,13 @@ SCENARIO_LIBRARY = [
 ]
 
 
+# Selector options in library order, for the sidebar
+SCENARIO_NAMES: Tuple[str, ...] = tuple(s.name for s in SCENARIO_LIBRARY)
+
+# Name index over the (immutable) library, built once at import
+_SCENARIO_BY_NAME: Dict[str, Scenario] = {s.name: s for s in SCENARIO_LIBRARY}
+
+
 def get_scenario(name: str) -> Optional[Scenario]:
     """Look up a scenario by name."""
-    for s in SCENARIO_LIBRARY:
-        if s.name == name:
-            return s
-    return None
+    return _SCENARIO_BY_NAME.get(name)
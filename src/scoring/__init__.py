@@ -1,3 +1,3 @@
-from src.scoring.tracker import ScoreTracker
+from src.scoring.tracker import ScoreTracker, score_components_batch
 
-__all__ = ["ScoreTracker"]
+__all__ = ["ScoreTracker", "score_components_batch"]
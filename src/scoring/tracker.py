@@ -7,15 +7,28 @@ Penalties for off-spec product, safety events, and ESD trips.
 from __future__ import annotations
 
 import math
-from dataclasses import dataclass, field
+from bisect import bisect_right
+from dataclasses import dataclass
 from typing import List, Dict
 
+import numpy as np
+
 from src.models.constants import LIMITS
-from src.models.plant_state import PlantState
-from src.safety.safety_system import SafetyResult
+from src.models.plant_state import STATE_COLUMNS, PlantState
+from src.safety.safety_system import SafetyBatchResult, SafetyResult
+
+
+# Letter grades by score band: below 60 is F, then D/C/B/A from each cut up
+_GRADE_CUTS = (60, 70, 80, 90)
+_GRADES = "FDCBA"
+
+
+def _grade(score: float) -> str:
+    """Letter grade for a 0-100 score."""
+    return _GRADES[bisect_right(_GRADE_CUTS, score)]
 
 
-@dataclass
+@dataclass(slots=True)
 class TurnScore:
     """Score breakdown for a single turn."""
 
@@ -28,15 +41,42 @@ class TurnScore:
 
     @property
     def grade(self) -> str:
-        if self.total >= 90:
-            return "A"
-        if self.total >= 80:
-            return "B"
-        if self.total >= 70:
-            return "C"
-        if self.total >= 60:
-            return "D"
-        return "F"
+        return _grade(self.total)
+
+
+# Inverse squared widths of the score penalty curves: purity Gaussian
+# (0.005 around spec), dP parabola (zero at the alarm limit) and level
+# Gaussian (0.3 around the 0.5 midpoint)
+_INV_PURITY_SIGMA2 = 1.0 / 0.005 ** 2
+_INV_DP_ALARM2 = 1.0 / LIMITS.dP_alarm ** 2
+_INV_LEVEL_SIGMA2 = 1.0 / 0.3 ** 2
+
+# Columns of (N, 8) state arrays read by score_components_batch
+_XB, _DP, _L_DRUM, _L_BOT = (
+    STATE_COLUMNS[name] for name in ("xB_sd", "dP_col", "L_Drum", "L_Bot")
+)
+
+
+def score_components_batch(states: np.ndarray) -> np.ndarray:
+    """Unrounded purity, pressure and level scores for N states at once.
+
+    Applies the score_turn formulas element-wise to an (N, 8) array in
+    STATE_FIELDS order (e.g. from Plant.step_batch), returning (N, 3).
+    """
+    states = np.atleast_2d(states)
+    xB_err = states[:, _XB] - LIMITS.xB_spec
+    purity = 40.0 * np.exp(-xB_err * xB_err * _INV_PURITY_SIGMA2)
+
+    dP = states[:, _DP]
+    pressure = 20.0 * np.maximum(0.0, 1.0 - dP * dP * _INV_DP_ALARM2)
+
+    drum_err = states[:, _L_DRUM] - 0.5
+    bot_err = states[:, _L_BOT] - 0.5
+    level = 20.0 * np.exp(
+        -(drum_err * drum_err + bot_err * bot_err) * _INV_LEVEL_SIGMA2
+    )
+
+    return np.column_stack((purity, pressure, level))
 
 
 class ScoreTracker:
@@ -44,27 +84,38 @@ class ScoreTracker:
 
     def __init__(self):
         self.history: List[TurnScore] = []
+        self._total_sum: float = 0.0  # running sum of history totals
         self.esd_count: int = 0
         self.interlock_count: int = 0
         self.alarm_count: int = 0
 
+    def reset(self) -> None:
+        """Clear the scored history and all event counters."""
+        self.history.clear()
+        self._total_sum = 0.0
+        self.esd_count = 0
+        self.interlock_count = 0
+        self.alarm_count = 0
+
     def score_turn(
         self, turn: int, state: PlantState, safety: SafetyResult
     ) -> TurnScore:
         """Evaluate operator performance for one turn."""
 
         # Purity: 40 points max, Gaussian penalty on deviation from spec
-        xB_err = abs(state.xB_sd - LIMITS.xB_spec)
-        purity = 40.0 * math.exp(-((xB_err / 0.005) ** 2))
+        xB_err = state.xB_sd - LIMITS.xB_spec
+        purity = 40.0 * math.exp(-xB_err * xB_err * _INV_PURITY_SIGMA2)
 
         # Pressure: 20 points max, penalty as dP approaches alarm threshold
-        dP_frac = state.dP_col / LIMITS.dP_alarm
-        pressure = 20.0 * max(0.0, 1.0 - dP_frac ** 2)
+        dP = state.dP_col
+        pressure = 20.0 * max(0.0, 1.0 - dP * dP * _INV_DP_ALARM2)
 
         # Levels: 20 points max, penalty for deviation from 0.5 midpoint
-        drum_err = abs(state.L_Drum - 0.5)
-        bot_err = abs(state.L_Bot - 0.5)
-        level = 20.0 * math.exp(-((drum_err / 0.3) ** 2 + (bot_err / 0.3) ** 2))
+        drum_err = state.L_Drum - 0.5
+        bot_err = state.L_Bot - 0.5
+        level = 20.0 * math.exp(
+            -(drum_err * drum_err + bot_err * bot_err) * _INV_LEVEL_SIGMA2
+        )
 
         # Safety penalties
         penalty = 0.0
@@ -89,26 +140,67 @@ class ScoreTracker:
             total=round(total, 1),
         )
         self.history.append(score)
+        self._total_sum += score.total
         return score
 
+    def score_turns_batch(
+        self, first_turn: int, states: np.ndarray, safety: SafetyBatchResult
+    ) -> np.ndarray:
+        """Score N consecutive turns at once, e.g. when replaying a rollout.
+
+        Args:
+            first_turn: Turn number of the first row.
+            states: (N, 8) committed states in STATE_FIELDS order.
+            safety: Per-row outcome from evaluate_safety_batch().
+
+        Returns:
+            Array of the N rounded turn totals, as appended to history.
+        """
+        purity, pressure, level = score_components_batch(states).T
+        esd = safety.esd_triggered
+        interlock = safety.interlock_active & ~esd
+        n_alarms = np.unpackbits(
+            safety.alarm_mask.astype(np.uint8)[:, None], axis=1
+        ).sum(axis=1)
+        n_alarms = np.where(esd | interlock, 0, n_alarms)
+        # n_alarms > 0 guard keeps alarm-free rows at +0.0, as in score_turn,
+        # rather than -3.0 * 0 == -0.0
+        alarm_penalty = np.where(n_alarms > 0, -3.0 * n_alarms, 0.0)
+        penalty = np.where(esd, -20.0, np.where(interlock, -10.0, alarm_penalty))
+        total = np.maximum(0.0, purity + pressure + level + penalty)
+
+        self.esd_count += int(esd.sum())
+        self.interlock_count += int(interlock.sum())
+        self.alarm_count += int(n_alarms.sum())
+
+        totals = []
+        rows = zip(
+            purity.tolist(), pressure.tolist(), level.tolist(),
+            penalty.tolist(), total.tolist(),
+        )
+        for turn, (pur, prs, lvl, pen, tot) in enumerate(rows, start=first_turn):
+            score = TurnScore(
+                turn=turn,
+                purity_score=round(pur, 1),
+                pressure_score=round(prs, 1),
+                level_score=round(lvl, 1),
+                safety_penalty=round(pen, 1),
+                total=round(tot, 1),
+            )
+            self.history.append(score)
+            self._total_sum += score.total
+            totals.append(score.total)
+        return np.array(totals)
+
     @property
     def average_score(self) -> float:
         if not self.history:
             return 0.0
-        return round(sum(s.total for s in self.history) / len(self.history), 1)
+        return round(self._total_sum / len(self.history), 1)
 
     @property
     def overall_grade(self) -> str:
-        avg = self.average_score
-        if avg >= 90:
-            return "A"
-        if avg >= 80:
-            return "B"
-        if avg >= 70:
-            return "C"
-        if avg >= 60:
-            return "D"
-        return "F"
+        return _grade(self.average_score)
 
     def summary(self) -> Dict[str, object]:
         return {
@@ -2,12 +2,23 @@
 
 from __future__ import annotations
 
-from typing import List, Dict
+from itertools import islice
+from typing import Dict, Sequence
 
 import streamlit as st
 
 
-def render_event_log(log: List[Dict[str, str]], max_display: int = 20) -> None:
+# Markdown line per event severity; unknown severities render plain
+_DEFAULT_TEMPLATE = "` T{turn} ` {msg}"
+_SEVERITY_TEMPLATES: Dict[str, str] = {
+    "esd": "` T{turn} ` :red[**ESD** {msg}]",
+    "interlock": "` T{turn} ` :orange[**INTLK** {msg}]",
+    "alarm": "` T{turn} ` :orange[**ALARM** {msg}]",
+    "action": _DEFAULT_TEMPLATE,
+}
+
+
+def render_event_log(log: Sequence[Dict[str, str]], max_display: int = 20) -> None:
     """Render the event log as a scrollable list."""
 
     st.markdown("### Event Log")
@@ -16,21 +27,10 @@ def render_event_log(log: List[Dict[str, str]], max_display: int = 20) -> None:
         st.caption("No events recorded yet.")
         return
 
-    recent = log[-max_display:]
-    recent.reverse()
-
-    for entry in recent:
+    # Newest first, without copying the whole log
+    for entry in islice(reversed(log), max_display):
         severity = entry.get("severity", "info")
         turn = entry.get("turn", "?")
         msg = entry.get("message", "")
-
-        if severity == "esd":
-            st.markdown(f"` T{turn} ` :red[**ESD** {msg}]")
-        elif severity == "interlock":
-            st.markdown(f"` T{turn} ` :orange[**INTLK** {msg}]")
-        elif severity == "alarm":
-            st.markdown(f"` T{turn} ` :orange[**ALARM** {msg}]")
-        elif severity == "action":
-            st.markdown(f"` T{turn} ` {msg}")
-        else:
-            st.markdown(f"` T{turn} ` {msg}")
+        template = _SEVERITY_TEMPLATES.get(severity, _DEFAULT_TEMPLATE)
+        st.markdown(template.format(turn=turn, msg=msg))
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import List
+from functools import lru_cache
+from io import BytesIO
+from typing import List, Tuple
 
 import streamlit as st
 from PIL import Image, ImageDraw, ImageFont
@@ -22,26 +24,14 @@ BADGE_RED = (220, 50, 50)
 GREEN = (50, 200, 100)
 BLUE_ACCENT = (70, 130, 220)
 
+# ImageDraw loads the default font afresh for every new Draw object unless
+# one is passed in, so load it once and hand it to every text call.
+_FONT = ImageFont.load_default()
+
 
 def _draw_rounded_rect(draw, xy, radius, fill, outline):
-    """Draw a rounded rectangle."""
-    x0, y0, x1, y1 = xy
-    r = radius
-    draw.rectangle([x0 + r, y0, x1 - r, y1], fill=fill)
-    draw.rectangle([x0, y0 + r, x1, y1 - r], fill=fill)
-    draw.pieslice([x0, y0, x0 + 2 * r, y0 + 2 * r], 180, 270, fill=fill)
-    draw.pieslice([x1 - 2 * r, y0, x1, y0 + 2 * r], 270, 360, fill=fill)
-    draw.pieslice([x0, y1 - 2 * r, x0 + 2 * r, y1], 90, 180, fill=fill)
-    draw.pieslice([x1 - 2 * r, y1 - 2 * r, x1, y1], 0, 90, fill=fill)
-    # Outline
-    draw.arc([x0, y0, x0 + 2 * r, y0 + 2 * r], 180, 270, fill=outline, width=2)
-    draw.arc([x1 - 2 * r, y0, x1, y0 + 2 * r], 270, 360, fill=outline, width=2)
-    draw.arc([x0, y1 - 2 * r, x0 + 2 * r, y1], 90, 180, fill=outline, width=2)
-    draw.arc([x1 - 2 * r, y1 - 2 * r, x1, y1], 0, 90, fill=outline, width=2)
-    draw.line([x0 + r, y0, x1 - r, y0], fill=outline, width=2)
-    draw.line([x0 + r, y1, x1 - r, y1], fill=outline, width=2)
-    draw.line([x0, y0 + r, x0, y1 - r], fill=outline, width=2)
-    draw.line([x1, y0 + r, x1, y1 - r], fill=outline, width=2)
+    """Draw a filled rounded rectangle with a 2px outline."""
+    draw.rounded_rectangle(xy, radius=radius, fill=fill, outline=outline, width=2)
 
 
 def render_schematic(
@@ -52,141 +42,179 @@ def render_schematic(
 ) -> None:
     """Render the process flow diagram with status overlays."""
 
-    W, H = 900, 520
+    # Reduce the state to exactly what the frame displays, so reruns that
+    # differ only below display precision hit the PNG cache.
+    hud_items = (
+        f"xB: {state.xB_sd:.4f}",
+        f"dP: {state.dP_col:.3f} bar",
+        f"T: {state.T_top:.1f} C",
+        f"Ref: {state.F_Reflux:.1f} t/h",
+        f"Reb: {state.F_Reboil:.2f} MW",
+        f"ToT: {state.F_ToTol:.1f} t/h",
+    )
+    level_h = int(40 * state.L_Drum)
+    duty_pct = min(1.0, state.F_Reboil / 3.5)
+    flame_color = (
+        int(200 + 55 * duty_pct),
+        int(100 + 80 * (1 - duty_pct)),
+        30,
+    )
+    if esd_triggered:
+        badge = ("ESD ACTIVE", BADGE_RED)
+    elif interlock_active:
+        badge = ("INTERLOCK", BADGE_ORANGE)
+    elif alarms:
+        badge = (f"{len(alarms)} ALARM(S)", BADGE_AMBER)
+    else:
+        badge = ("NORMAL", GREEN)
+
+    png = _render_png(hud_items, level_h, flame_color, badge)
+    st.image(png, use_container_width=True)
+
+
+# Frame size and equipment anchors (top-left corners), shared by the static
+# background and the per-frame overlays
+W, H = 900, 520
+COL_X, COL_Y, COL_W, COL_H = 350, 60, 80, 340
+COND_X, COND_Y = 520, 40
+DRUM_X, DRUM_Y = 660, 35
+REB_X, REB_Y = 320, 440
+
+
+@lru_cache(maxsize=1)
+def _background() -> Image.Image:
+    """Draw everything that does not depend on the plant state, once.
+
+    None of the per-frame overlays (drum level, flame, HUD, badge) cross the
+    piping, so drawing them over a copy of this frame gives the same pixels
+    as drawing the whole diagram in order.
+    """
     img = Image.new("RGB", (W, H), BG)
     draw = ImageDraw.Draw(img)
 
     # --- Column (center tall rectangle) ---
-    col_x, col_y = 350, 60
-    col_w, col_h = 80, 340
     _draw_rounded_rect(
         draw,
-        (col_x, col_y, col_x + col_w, col_y + col_h),
+        (COL_X, COL_Y, COL_X + COL_W, COL_Y + COL_H),
         12,
         EQUIP,
         EQUIP_BORDER,
     )
     # Column trays (horizontal lines)
     for i in range(1, 8):
-        ty = col_y + i * (col_h // 8)
+        ty = COL_Y + i * (COL_H // 8)
         draw.line(
-            [col_x + 10, ty, col_x + col_w - 10, ty], fill=EQUIP_BORDER, width=1
+            (COL_X + 10, ty, COL_X + COL_W - 10, ty), fill=EQUIP_BORDER, width=1
         )
-    draw.text((col_x + 10, col_y + 5), "COLUMN", fill=TEXT_COLOR)
+    draw.text((COL_X + 10, COL_Y + 5), "COLUMN", fill=TEXT_COLOR, font=_FONT)
 
     # --- Condenser (top right) ---
-    cond_x, cond_y = 520, 40
     _draw_rounded_rect(
-        draw, (cond_x, cond_y, cond_x + 100, cond_y + 50), 8, EQUIP, EQUIP_BORDER
-    )
-    draw.text((cond_x + 10, cond_y + 15), "CONDENSER", fill=TEXT_COLOR)
-
-    # Overhead vapor pipe: column top -> condenser
-    draw.line(
-        [col_x + col_w, col_y + 25, cond_x, cond_y + 25], fill=PIPE, width=3
+        draw, (COND_X, COND_Y, COND_X + 100, COND_Y + 50), 8, EQUIP, EQUIP_BORDER
     )
+    draw.text((COND_X + 10, COND_Y + 15), "CONDENSER", fill=TEXT_COLOR, font=_FONT)
 
     # --- Reflux Drum (right of condenser) ---
-    drum_x, drum_y = 660, 35
     _draw_rounded_rect(
         draw,
-        (drum_x, drum_y, drum_x + 120, drum_y + 60),
+        (DRUM_X, DRUM_Y, DRUM_X + 120, DRUM_Y + 60),
         15,
         EQUIP,
         EQUIP_BORDER,
     )
-    draw.text((drum_x + 15, drum_y + 5), "REFLUX", fill=TEXT_COLOR)
-    draw.text((drum_x + 20, drum_y + 22), "DRUM", fill=TEXT_COLOR)
-    # Level indicator
-    level_h = int(40 * state.L_Drum)
-    draw.rectangle(
-        [drum_x + 85, drum_y + 50 - level_h, drum_x + 105, drum_y + 50],
-        fill=BLUE_ACCENT,
-    )
-
-    # Condenser -> drum pipe
-    draw.line(
-        [cond_x + 100, cond_y + 25, drum_x, drum_y + 30], fill=PIPE, width=3
-    )
-
-    # Reflux return pipe: drum bottom -> column top
-    draw.line([drum_x + 60, drum_y + 60, drum_x + 60, 140], fill=PIPE, width=3)
-    draw.line([drum_x + 60, 140, col_x + col_w, 140], fill=PIPE, width=3)
+    draw.text((DRUM_X + 15, DRUM_Y + 5), "REFLUX", fill=TEXT_COLOR, font=_FONT)
+    draw.text((DRUM_X + 20, DRUM_Y + 22), "DRUM", fill=TEXT_COLOR, font=_FONT)
 
     # --- Reboiler (bottom) ---
-    reb_x, reb_y = 320, 440
     _draw_rounded_rect(
         draw,
-        (reb_x, reb_y, reb_x + 140, reb_y + 55),
+        (REB_X, REB_Y, REB_X + 140, REB_Y + 55),
         10,
         EQUIP,
         EQUIP_BORDER,
     )
-    draw.text((reb_x + 15, reb_y + 8), "REBOILER", fill=TEXT_COLOR)
-    # Flame indicator
-    duty_pct = min(1.0, state.F_Reboil / 3.5)
-    flame_color = (
-        int(200 + 55 * duty_pct),
-        int(100 + 80 * (1 - duty_pct)),
-        30,
-    )
-    draw.ellipse(
-        [reb_x + 100, reb_y + 20, reb_x + 130, reb_y + 45],
-        fill=flame_color,
+    draw.text((REB_X + 15, REB_Y + 8), "REBOILER", fill=TEXT_COLOR, font=_FONT)
+
+    # --- Piping: one polyline per connected run, drawn over the equipment ---
+    pipes = (
+        # Overhead vapor: column top -> condenser
+        (COL_X + COL_W, COL_Y + 25, COND_X, COND_Y + 25),
+        # Condenser -> drum
+        (COND_X + 100, COND_Y + 25, DRUM_X, DRUM_Y + 30),
+        # Reflux return: drum bottom -> down -> column top
+        (DRUM_X + 60, DRUM_Y + 60, DRUM_X + 60, 140, COL_X + COL_W, 140),
+        # Column bottom -> reboiler
+        (COL_X + COL_W // 2, COL_Y + COL_H, COL_X + COL_W // 2, REB_Y),
+        # Feed inlet (left)
+        (150, 200, COL_X, 200),
+        # Side draw (benzene product, left middle)
+        (COL_X, 280, 150, 280),
+        # Toluene transfer (bottom right)
+        (REB_X + 140, REB_Y + 28, REB_X + 240, REB_Y + 28),
     )
+    for points in pipes:
+        draw.line(points, fill=PIPE, width=3)
+
+    draw.text((155, 185), "FEED", fill=GREEN, font=_FONT)
+    draw.text((155, 265), "BENZENE", fill=GREEN, font=_FONT)
+    draw.text((REB_X + 150, REB_Y + 10), "TOLUENE", fill=GREEN, font=_FONT)
+    return img
 
-    # Column bottom -> reboiler
-    draw.line(
-        [col_x + col_w // 2, col_y + col_h, col_x + col_w // 2, reb_y],
-        fill=PIPE,
-        width=3,
-    )
 
-    # --- Feed inlet (left) ---
-    draw.line([150, 200, col_x, 200], fill=PIPE, width=3)
-    draw.text((155, 185), "FEED", fill=GREEN)
+@lru_cache(maxsize=256)
+def _render_png(
+    hud_items: Tuple[str, ...],
+    level_h: int,
+    flame_color: Tuple[int, int, int],
+    badge: Tuple[str, Tuple[int, int, int]],
+) -> bytes:
+    """Draw the state overlays on the static frame and return PNG bytes."""
 
-    # --- Side draw (benzene product, left middle) ---
-    draw.line([col_x, 280, 150, 280], fill=PIPE, width=3)
-    draw.text((155, 265), "BENZENE", fill=GREEN)
+    img = _background().copy()
+    draw = ImageDraw.Draw(img)
 
-    # --- Toluene transfer (bottom right) ---
-    draw.line(
-        [reb_x + 140, reb_y + 28, reb_x + 240, reb_y + 28], fill=PIPE, width=3
+    # Drum level indicator
+    draw.rectangle(
+        (DRUM_X + 85, DRUM_Y + 50 - level_h, DRUM_X + 105, DRUM_Y + 50),
+        fill=BLUE_ACCENT,
+    )
+    # Reboiler flame indicator
+    draw.ellipse(
+        (REB_X + 100, REB_Y + 20, REB_X + 130, REB_Y + 45),
+        fill=flame_color,
     )
-    draw.text((reb_x + 150, reb_y + 10), "TOLUENE", fill=GREEN)
 
     # --- HUD: key values ---
-    hud_y = 420
-    hud_items = [
-        f"xB: {state.xB_sd:.4f}",
-        f"dP: {state.dP_col:.3f} bar",
-        f"T: {state.T_top:.1f} C",
-        f"Ref: {state.F_Reflux:.1f} t/h",
-        f"Reb: {state.F_Reboil:.2f} MW",
-        f"ToT: {state.F_ToTol:.1f} t/h",
-    ]
     x_pos = 20
     for item in hud_items:
-        draw.text((x_pos, H - 25), item, fill=TEXT_COLOR)
+        draw.text((x_pos, H - 25), item, fill=TEXT_COLOR, font=_FONT)
         x_pos += 145
 
-    # --- Safety badges ---
-    badge_y = col_y + 5
-    if esd_triggered:
-        _draw_badge(draw, 30, badge_y, "ESD ACTIVE", BADGE_RED)
-    elif interlock_active:
-        _draw_badge(draw, 30, badge_y, "INTERLOCK", BADGE_ORANGE)
-    elif alarms:
-        _draw_badge(draw, 30, badge_y, f"{len(alarms)} ALARM(S)", BADGE_AMBER)
-    else:
-        _draw_badge(draw, 30, badge_y, "NORMAL", GREEN)
+    # --- Safety badge ---
+    _draw_badge(img, 30, COL_Y + 5, *badge)
+
+    # Encode once with a fast zlib level; the PNG is transient browser output.
+    buf = BytesIO()
+    img.save(buf, format="PNG", compress_level=1)
+    return buf.getvalue()
+
+
+@lru_cache(maxsize=None)
+def _badge_sprite(text: str, color: Tuple[int, int, int]) -> Image.Image:
+    """Render a status badge once as a transparent-cornered sprite.
 
-    st.image(img, use_container_width=True)
+    Badge texts come from a small fixed set, so each is drawn only once.
+    """
+    # Measured text width plus 10 px padding on each side
+    tw = round(_FONT.getlength(text)) + 20
+    sprite = Image.new("RGBA", (tw + 1, 27), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(sprite)
+    draw.rounded_rectangle((0, 0, tw, 26), radius=6, fill=color)
+    draw.text((10, 5), text, fill=(0, 0, 0), font=_FONT)
+    return sprite
 
 
-def _draw_badge(draw, x, y, text, color):
-    """Draw a status badge."""
-    tw = len(text) * 9 + 20
-    draw.rounded_rectangle([x, y, x + tw, y + 26], radius=6, fill=color)
-    draw.text((x + 10, y + 5), text, fill=(0, 0, 0))
+def _draw_badge(img, x, y, text, color):
+    """Paste a status badge."""
+    sprite = _badge_sprite(text, color)
+    img.paste(sprite, (x, y), sprite)
@@ -2,27 +2,26 @@
 
 from __future__ import annotations
 
-from typing import Dict, Tuple
+from typing import Mapping, Tuple
 
 import streamlit as st
 
-from src.scenarios.library import SCENARIO_LIBRARY, Scenario
+from src.scenarios.library import SCENARIO_NAMES, get_scenario
 
 
-def render_sidebar() -> Tuple[Dict[str, float], str]:
+def render_sidebar() -> Tuple[Mapping[str, float], str]:
     """Render the sidebar and return (scenario_dict, controller_name)."""
 
     st.sidebar.header("Training Scenario")
 
-    scenario_names = [s.name for s in SCENARIO_LIBRARY]
     selected_name = st.sidebar.selectbox(
         "Scenario",
-        scenario_names,
+        SCENARIO_NAMES,
         index=0,
         help="Choose a pre-built scenario or Custom to set your own.",
     )
 
-    scenario = next(s for s in SCENARIO_LIBRARY if s.name == selected_name)
+    scenario = get_scenario(selected_name)
 
     if selected_name == "Custom":
         F_feed = st.sidebar.slider("Feed rate (t/h)", 50.0, 120.0, 80.0, 1.0)
@@ -60,8 +59,7 @@ def render_sidebar() -> Tuple[Dict[str, float], str]:
     st.sidebar.divider()
 
     if st.sidebar.button("Reset Plant", type="secondary", use_container_width=True):
-        for key in list(st.session_state.keys()):
-            del st.session_state[key]
+        st.session_state.clear()
         st.rerun()
 
     return scenario_dict, controller_name
@@ -2,57 +2,76 @@
 
 from __future__ import annotations
 
-from typing import List, Dict
+from typing import Dict, Tuple
 
-import streamlit as st
+import altair as alt
+import numpy as np
 import pandas as pd
+import streamlit as st
 
 from src.models.constants import LIMITS
-
-
-def render_trends(history: List[Dict[str, float]]) -> None:
-    """Render trend charts from plant state history."""
+from src.models.plant_state import STATE_COLUMNS
+
+
+# (title, plotted state fields, constant reference lines) per trend chart
+_CHARTS = (
+    ("Benzene Purity (xB)", ("xB_sd",), {"Spec": LIMITS.xB_spec}),
+    (
+        "Column dP (bar)",
+        ("dP_col",),
+        {"Alarm": LIMITS.dP_alarm, "Interlock": LIMITS.dP_interlock},
+    ),
+    ("Overhead Temperature (C)", ("T_top",), {"Alarm": LIMITS.T_top_alarm}),
+    ("Levels", ("L_Drum", "L_Bot"), {"Low Alarm": LIMITS.L_drum_alarm}),
+)
+
+
+def _trend_chart(
+    history: np.ndarray, fields: Tuple[str, ...], refs: Dict[str, float]
+) -> alt.LayerChart:
+    """Line chart of history columns with the limits drawn as rule marks.
+
+    Reference values are plotted as one horizontal rule each rather than
+    as constant columns repeated on every turn.
+    """
+    df = pd.DataFrame({name: history[:, STATE_COLUMNS[name]] for name in fields})
+    df.index.name = "Turn"
+    lines = (
+        alt.Chart(df.reset_index())
+        .transform_fold(list(fields), as_=["Series", "Value"])
+        .mark_line()
+        .encode(
+            x="Turn:Q",
+            y=alt.Y("Value:Q", title=None, scale=alt.Scale(zero=False)),
+            color="Series:N",
+        )
+    )
+    limits = pd.DataFrame({"Series": list(refs), "Value": list(refs.values())})
+    rules = (
+        alt.Chart(limits)
+        .mark_rule(strokeDash=[4, 4])
+        .encode(y="Value:Q", color="Series:N")
+    )
+    return alt.layer(lines, rules).properties(height=200)
+
+
+def render_trends(history: np.ndarray) -> None:
+    """Render trend charts from an (N, 8) state history in STATE_FIELDS order."""
 
     if len(history) < 2:
         st.info("Trend charts will appear after 2+ turns.")
         return
 
-    df = pd.DataFrame(history)
-    df.index.name = "Turn"
-
     st.markdown("### Process Trends")
 
-    c1, c2 = st.columns(2)
-
-    with c1:
-        st.markdown("**Benzene Purity (xB)**")
-        purity_df = df[["xB_sd"]].copy()
-        purity_df["Spec"] = LIMITS.xB_spec
-        st.line_chart(purity_df, height=200)
-
-    with c2:
-        st.markdown("**Column dP (bar)**")
-        dp_df = df[["dP_col"]].copy()
-        dp_df["Alarm"] = LIMITS.dP_alarm
-        dp_df["Interlock"] = LIMITS.dP_interlock
-        st.line_chart(dp_df, height=200)
-
-    c3, c4 = st.columns(2)
-
-    with c3:
-        st.markdown("**Overhead Temperature (C)**")
-        t_df = df[["T_top"]].copy()
-        t_df["Alarm"] = LIMITS.T_top_alarm
-        st.line_chart(t_df, height=200)
-
-    with c4:
-        st.markdown("**Levels**")
-        lvl_df = df[["L_Drum", "L_Bot"]].copy()
-        lvl_df["Low Alarm"] = LIMITS.L_drum_alarm
-        st.line_chart(lvl_df, height=200)
+    for row in (_CHARTS[:2], _CHARTS[2:]):
+        for col, (title, fields, refs) in zip(st.columns(2), row):
+            with col:
+                st.markdown(f"**{title}**")
+                st.altair_chart(_trend_chart(history, fields, refs))
 
 
-def render_score_trend(scores: List[float]) -> None:
+def render_score_trend(scores: np.ndarray) -> None:
     """Render the score history chart."""
 
     if len(scores) < 2:
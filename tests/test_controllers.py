@@ -1,5 +1,7 @@
 """Tests for controllers."""
 
+from dataclasses import replace
+
 import pytest
 
 from src.models.plant_state import PlantState
@@ -8,9 +10,11 @@ from src.controllers.nn_controller import NNController
 from src.controllers.mpc_controller import MPCController
 
 
+_BASE = PlantState(**STEADY_STATE)
+
+
 def _make_state(**overrides) -> PlantState:
-    d = {**STEADY_STATE, **overrides}
-    return PlantState.from_dict(d)
+    return replace(_BASE, **overrides)
 
 
 class TestNNController:
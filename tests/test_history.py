@@ -0,0 +1,41 @@
+"""Tests for the numpy-backed history buffers."""
+
+import numpy as np
+
+from src.models.history import HistoryBuffer
+from src.models.plant_state import PlantState, STATE_FIELDS
+from src.models.constants import STEADY_STATE
+
+
+class TestHistoryBuffer:
+    def test_starts_empty(self):
+        buf = HistoryBuffer(len(STATE_FIELDS))
+        assert len(buf) == 0
+        assert buf.data.shape == (0, len(STATE_FIELDS))
+
+    def test_appends_rows_in_order(self):
+        buf = HistoryBuffer(len(STATE_FIELDS))
+        state = PlantState(**STEADY_STATE)
+        buf.append(state.to_tuple())
+        buf.append(state.to_tuple())
+        assert len(buf) == 2
+        np.testing.assert_array_equal(buf.data[1], state.to_tuple())
+
+    def test_grows_past_capacity(self):
+        buf = HistoryBuffer(capacity=2)
+        for i in range(5):
+            buf.append(float(i))
+        np.testing.assert_array_equal(buf.data, [0.0, 1.0, 2.0, 3.0, 4.0])
+
+    def test_grows_from_zero_capacity(self):
+        buf = HistoryBuffer(len(STATE_FIELDS), capacity=0)
+        buf.append(PlantState(**STEADY_STATE).to_tuple())
+        buf.append(PlantState(**STEADY_STATE).to_tuple())
+        assert buf.data.shape == (2, len(STATE_FIELDS))
+
+    def test_grows_2d_past_capacity(self):
+        buf = HistoryBuffer(width=2, capacity=1)
+        for i in range(3):
+            buf.append((i, -i))
+        assert buf.data.shape == (3, 2)
+        np.testing.assert_array_equal(buf.data[:, 1], [0.0, -1.0, -2.0])
@@ -1,12 +1,18 @@
 """Tests for plant model physics and state management."""
 
+from dataclasses import fields, replace
+
+import numpy as np
 import pytest
 
 from src.models.plant import Plant, cap_moves
-from src.models.plant_state import PlantState
+from src.models.plant_state import PlantState, STATE_COLUMNS, STATE_FIELDS
 from src.models.constants import STEADY_STATE, MOVE_CAPS, DEFAULT_SCENARIO
 
 
+_BASE = PlantState(**STEADY_STATE)
+
+
 class TestPlantState:
     """PlantState dataclass operations."""
 
@@ -16,6 +22,21 @@ class TestPlantState:
         restored = PlantState.from_dict(d)
         assert restored == state
 
+    def test_to_tuple_follows_state_fields(self):
+        state = PlantState(**STEADY_STATE)
+        assert state.to_tuple() == tuple(STEADY_STATE[k] for k in STATE_FIELDS)
+
+    def test_state_columns_index_to_array(self):
+        arr = PlantState(**STEADY_STATE).to_array()
+        for name, col in STATE_COLUMNS.items():
+            assert arr[col] == STEADY_STATE[name]
+
+    def test_to_array_roundtrip(self):
+        state = PlantState(**STEADY_STATE)
+        restored = PlantState.from_array(state.to_array())
+        assert restored == state
+        assert type(restored.xB_sd) is float
+
     def test_from_dict_ignores_extra_keys(self):
         d = {**STEADY_STATE, "extra_key": 999}
         state = PlantState.from_dict(d)
@@ -85,12 +106,68 @@ class TestPlantStep:
     def test_levels_stay_bounded(self):
         plant = Plant()
         u = {"SP_F_Reflux": 45.0, "SP_F_Reboil": 3.5, "SP_F_ToTol": 90.0}
-        for _ in range(50):
-            x = plant.step(u, DEFAULT_SCENARIO)
-            plant.commit(x)
+        plant.rollout(u, DEFAULT_SCENARIO, 50)
         assert 0.0 <= plant.state.L_Drum <= 1.0
         assert 0.0 <= plant.state.L_Bot <= 1.0
 
+    def test_rollout_matches_step_commit_loop(self):
+        u = {"SP_F_Reflux": 45.0, "SP_F_Reboil": 3.5, "SP_F_ToTol": 90.0}
+        stepped = Plant()
+        for _ in range(5):
+            stepped.commit(stepped.step(u, DEFAULT_SCENARIO))
+        rolled = Plant()
+        final = rolled.rollout(u, DEFAULT_SCENARIO, 5)
+        assert final == stepped.state
+        assert rolled.state == final
+
+
+class TestPlantStepBatch:
+    """Vectorised what-if stepping."""
+
+    def test_batch_matches_scalar_step(self):
+        plant = Plant()
+        sc = {**DEFAULT_SCENARIO, "Fouling_Cond": 0.3, "Fouling_Reb": 0.2}
+        u = {
+            "SP_F_Reflux": np.array([10.0, 25.0, 45.0]),
+            "SP_F_Reboil": np.array([0.3, 1.2, 3.5]),
+            "SP_F_ToTol": np.array([30.0, 55.0, 90.0]),
+        }
+        batch = plant.step_batch(u, sc)
+        assert batch.shape == (3, len(fields(PlantState)))
+        for i, row in enumerate(batch):
+            u_i = {k: float(v[i]) for k, v in u.items()}
+            expected = plant.step(u_i, sc)
+            assert row == pytest.approx(expected.to_array())
+
+    def test_physics_batch_per_rollout_states_and_scenarios(self):
+        starts = [
+            _BASE,
+            replace(_BASE, xB_sd=0.99, dP_col=0.2),
+            replace(_BASE, L_Drum=0.2, F_Reboil=2.0),
+        ]
+        sc = {
+            "F_feed": np.array([80.0, 95.0, 70.0]),
+            "Fouling_Cond": np.array([0.0, 0.3, 0.1]),
+            "Fouling_Reb": np.array([0.0, 0.2, 0.4]),
+        }
+        u = {"SP_F_Reflux": 27.0, "SP_F_Reboil": 1.3, "SP_F_ToTol": 57.0}
+        batch = Plant.physics_batch(np.array([s.to_array() for s in starts]), u, sc)
+        for i, start in enumerate(starts):
+            plant = Plant(initial_state=start.to_dict())
+            expected = plant.step(u, {k: float(v[i]) for k, v in sc.items()})
+            assert batch[i] == pytest.approx(expected.to_array())
+
+    def test_batch_does_not_mutate_state(self):
+        plant = Plant()
+        original = plant.state
+        u = {
+            "SP_F_Reflux": np.full(4, 30.0),
+            "SP_F_Reboil": np.full(4, 1.5),
+            "SP_F_ToTol": np.full(4, 60.0),
+        }
+        plant.step_batch(u, DEFAULT_SCENARIO)
+        assert plant.state == original
+
 
 class TestPlantCommit:
     """Plant commit (state acceptance)."""
@@ -112,50 +189,46 @@ class TestPlantCommit:
 
 
 class TestCapMoves:
-    """Move rate limiting."""
+    """Move rate limiting.
+
+    cap_moves returns either the request itself or current +/- cap computed
+    exactly as below, so plain == holds bit-for-bit; no approx needed.
+    """
 
     def test_reflux_capped_up(self):
-        state = PlantState(**STEADY_STATE)
+        state = _BASE
         u = {"SP_F_Reflux": 40.0, "SP_F_Reboil": 1.2, "SP_F_ToTol": 55.0}
         capped = cap_moves(u, state)
-        assert capped["SP_F_Reflux"] == pytest.approx(
-            state.F_Reflux + MOVE_CAPS["SP_F_Reflux"]
-        )
+        assert capped["SP_F_Reflux"] == state.F_Reflux + MOVE_CAPS["SP_F_Reflux"]
 
     def test_reflux_capped_down(self):
-        state = PlantState(**STEADY_STATE)
+        state = _BASE
         u = {"SP_F_Reflux": 10.0, "SP_F_Reboil": 1.2, "SP_F_ToTol": 55.0}
         capped = cap_moves(u, state)
-        assert capped["SP_F_Reflux"] == pytest.approx(
-            state.F_Reflux - MOVE_CAPS["SP_F_Reflux"]
-        )
+        assert capped["SP_F_Reflux"] == state.F_Reflux - MOVE_CAPS["SP_F_Reflux"]
 
     def test_reboil_capped(self):
-        state = PlantState(**STEADY_STATE)
+        state = _BASE
         u = {"SP_F_Reflux": 25.0, "SP_F_Reboil": 3.5, "SP_F_ToTol": 55.0}
         capped = cap_moves(u, state)
-        assert capped["SP_F_Reboil"] == pytest.approx(
-            state.F_Reboil + MOVE_CAPS["SP_F_Reboil"]
-        )
+        assert capped["SP_F_Reboil"] == state.F_Reboil + MOVE_CAPS["SP_F_Reboil"]
 
     def test_transfer_capped(self):
-        state = PlantState(**STEADY_STATE)
+        state = _BASE
         u = {"SP_F_Reflux": 25.0, "SP_F_Reboil": 1.2, "SP_F_ToTol": 90.0}
         capped = cap_moves(u, state)
-        assert capped["SP_F_ToTol"] == pytest.approx(
-            state.F_ToTol + MOVE_CAPS["SP_F_ToTol"]
-        )
+        assert capped["SP_F_ToTol"] == state.F_ToTol + MOVE_CAPS["SP_F_ToTol"]
 
     def test_small_move_not_capped(self):
-        state = PlantState(**STEADY_STATE)
+        state = _BASE
         u = {"SP_F_Reflux": 25.5, "SP_F_Reboil": 1.25, "SP_F_ToTol": 56.0}
         capped = cap_moves(u, state)
-        assert capped["SP_F_Reflux"] == pytest.approx(25.5)
-        assert capped["SP_F_Reboil"] == pytest.approx(1.25)
-        assert capped["SP_F_ToTol"] == pytest.approx(56.0)
+        assert capped["SP_F_Reflux"] == 25.5
+        assert capped["SP_F_Reboil"] == 1.25
+        assert capped["SP_F_ToTol"] == 56.0
 
     def test_all_moves_capped_simultaneously(self):
-        state = PlantState(**STEADY_STATE)
+        state = _BASE
         u = {"SP_F_Reflux": 45.0, "SP_F_Reboil": 3.5, "SP_F_ToTol": 90.0}
         capped = cap_moves(u, state)
         for sp_key, pv_key in [
@@ -1,20 +1,37 @@
 """Tests for the three-tier safety system."""
 
+import importlib.util
+from dataclasses import astuple, replace
+from types import MappingProxyType
+
+import numpy as np
 import pytest
 
+from src.models import constants
 from src.models.plant_state import PlantState
+from src.safety import safety_system
 from src.models.constants import LIMITS, STEADY_STATE
-from src.safety.safety_system import evaluate_safety, SafetyResult
+from src.safety.safety_system import (
+    AlarmCode,
+    dp_tier,
+    evaluate_safety,
+    evaluate_safety_batch,
+    SafetyResult,
+)
+
+
+_BASE = PlantState(**STEADY_STATE)
 
 
 def _make_state(**overrides) -> PlantState:
     """Create a PlantState with optional overrides from steady state."""
-    d = {**STEADY_STATE, **overrides}
-    return PlantState.from_dict(d)
+    return replace(_BASE, **overrides)
 
 
-def _default_u():
-    return {"SP_F_Reflux": 25.0, "SP_F_Reboil": 1.2, "SP_F_ToTol": 55.0}
+# Shared read-only inputs; evaluate_safety copies before adjusting.
+_DEFAULT_U = MappingProxyType(
+    {"SP_F_Reflux": 25.0, "SP_F_Reboil": 1.2, "SP_F_ToTol": 55.0}
+)
 
 
 # ---------------------------------------------------------------------------
@@ -23,42 +40,56 @@ def _default_u():
 
 
 class TestAlarms:
-    def test_high_dP_alarm(self):
-        state = _make_state(dP_col=0.31)
-        result = evaluate_safety(state, _default_u())
-        assert any("HIGH dP" in a for a in result.alarms)
-
-    def test_high_T_alarm(self):
-        state = _make_state(T_top=101.0)
-        result = evaluate_safety(state, _default_u())
-        assert any("HIGH T_top" in a for a in result.alarms)
-
-    def test_off_spec_alarm(self):
-        state = _make_state(xB_sd=0.9985)
-        result = evaluate_safety(state, _default_u())
-        assert any("OFF-SPEC" in a for a in result.alarms)
-
-    def test_low_drum_alarm(self):
-        state = _make_state(L_Drum=0.08)
-        result = evaluate_safety(state, _default_u())
-        assert any("LOW drum" in a for a in result.alarms)
-
-    def test_low_bottoms_alarm(self):
-        state = _make_state(L_Bot=0.08)
-        result = evaluate_safety(state, _default_u())
-        assert any("LOW bottoms" in a for a in result.alarms)
+    @pytest.mark.parametrize(
+        "overrides, text",
+        [
+            ({"dP_col": 0.31}, "HIGH dP"),
+            ({"T_top": 101.0}, "HIGH T_top"),
+            ({"xB_sd": 0.9985}, "OFF-SPEC"),
+            ({"L_Drum": 0.08}, "LOW drum"),
+            ({"L_Bot": 0.08}, "LOW bottoms"),
+        ],
+    )
+    def test_single_alarm(self, overrides, text):
+        state = _make_state(**overrides)
+        result = evaluate_safety(state, _DEFAULT_U)
+        assert any(text in a for a in result.alarms)
 
     def test_multiple_alarms(self):
         state = _make_state(dP_col=0.31, T_top=101.0, xB_sd=0.998)
-        result = evaluate_safety(state, _default_u())
+        result = evaluate_safety(state, _DEFAULT_U)
         assert len(result.alarms) >= 3
 
+    def test_alarm_mask_matches_alarms(self):
+        state = _make_state(dP_col=0.31, xB_sd=0.998, L_Bot=0.08)
+        result = evaluate_safety(state, _DEFAULT_U)
+        assert result.alarm_mask == 0b10101
+        assert bin(result.alarm_mask).count("1") == len(result.alarms)
+
+    def test_alarm_codes_name_tripped_rows(self):
+        state = _make_state(T_top=101.0, L_Drum=0.08, xB_sd=0.9995)
+        result = evaluate_safety(state, _DEFAULT_U)
+        assert result.alarm_codes == AlarmCode.HIGH_T_TOP | AlarmCode.LOW_DRUM
+        assert not result.alarm_codes & AlarmCode.HIGH_DP
+
     def test_no_alarm_in_normal(self):
         state = _make_state(xB_sd=0.9995)
-        result = evaluate_safety(state, _default_u())
+        result = evaluate_safety(state, _DEFAULT_U)
         assert len(result.alarms) == 0
         assert result.is_clear
 
+    def test_exact_alarm_thresholds_no_alarm(self):
+        """At exactly the alarm thresholds, no alarm (must exceed)."""
+        state = _make_state(
+            dP_col=LIMITS.dP_alarm,
+            T_top=LIMITS.T_top_alarm,
+            xB_sd=LIMITS.xB_spec,
+            L_Drum=LIMITS.L_drum_alarm,
+            L_Bot=LIMITS.L_bot_alarm,
+        )
+        result = evaluate_safety(state, _DEFAULT_U)
+        assert result.is_clear
+
 
 # ---------------------------------------------------------------------------
 # Tier 2: Interlocks
@@ -68,7 +99,7 @@ class TestAlarms:
 class TestInterlocks:
     def test_flooding_interlock_triggered(self):
         state = _make_state(dP_col=0.335)
-        result = evaluate_safety(state, _default_u())
+        result = evaluate_safety(state, _DEFAULT_U)
         assert result.interlock_active
         assert "Flooding" in result.interlock_reason
 
@@ -98,7 +129,7 @@ class TestInterlocks:
 
     def test_no_interlock_below_threshold(self):
         state = _make_state(dP_col=0.32)
-        result = evaluate_safety(state, _default_u())
+        result = evaluate_safety(state, _DEFAULT_U)
         assert not result.interlock_active
 
 
@@ -110,44 +141,44 @@ class TestInterlocks:
 class TestESD:
     def test_critical_dP_triggers_esd(self):
         state = _make_state(dP_col=0.35)
-        result = evaluate_safety(state, _default_u())
+        result = evaluate_safety(state, _DEFAULT_U)
         assert result.esd_triggered
         assert "dP" in result.esd_reason
 
     def test_critical_T_triggers_esd(self):
         state = _make_state(T_top=104.0)
-        result = evaluate_safety(state, _default_u())
+        result = evaluate_safety(state, _DEFAULT_U)
         assert result.esd_triggered
         assert "T" in result.esd_reason
 
     def test_critical_drum_level_triggers_esd(self):
         state = _make_state(L_Drum=0.04)
-        result = evaluate_safety(state, _default_u())
+        result = evaluate_safety(state, _DEFAULT_U)
         assert result.esd_triggered
         assert "drum" in result.esd_reason
 
     def test_exact_esd_threshold_no_trip(self):
         """At exactly the threshold, no ESD (must exceed)."""
         state = _make_state(dP_col=LIMITS.dP_esd)
-        result = evaluate_safety(state, _default_u())
+        result = evaluate_safety(state, _DEFAULT_U)
         assert not result.esd_triggered
 
     def test_just_above_esd_threshold(self):
         state = _make_state(dP_col=LIMITS.dP_esd + 0.001)
-        result = evaluate_safety(state, _default_u())
+        result = evaluate_safety(state, _DEFAULT_U)
         assert result.esd_triggered
 
     def test_esd_preempts_interlock(self):
         """ESD should trigger before interlock logic runs."""
         state = _make_state(dP_col=0.35)
-        result = evaluate_safety(state, _default_u())
+        result = evaluate_safety(state, _DEFAULT_U)
         assert result.esd_triggered
         # When ESD fires, we return early - no interlock
         assert not result.interlock_active
 
     def test_no_esd_in_normal(self):
         state = _make_state()
-        result = evaluate_safety(state, _default_u())
+        result = evaluate_safety(state, _DEFAULT_U)
         assert not result.esd_triggered
 
 
@@ -160,23 +191,71 @@ class TestSafetyIntegration:
     def test_alarm_and_interlock_together(self):
         """Interlock range also triggers alarm."""
         state = _make_state(dP_col=0.335)
-        result = evaluate_safety(state, _default_u())
+        result = evaluate_safety(state, _DEFAULT_U)
         assert result.interlock_active
         assert any("HIGH dP" in a for a in result.alarms)
 
     def test_esd_returns_early_no_alarms(self):
         """ESD returns immediately - no alarms populated."""
         state = _make_state(dP_col=0.35)
-        result = evaluate_safety(state, _default_u())
+        result = evaluate_safety(state, _DEFAULT_U)
         assert result.esd_triggered
         assert len(result.alarms) == 0
 
     def test_safety_clear_flag(self):
         state = _make_state(xB_sd=0.9995)
-        result = evaluate_safety(state, _default_u())
+        result = evaluate_safety(state, _DEFAULT_U)
         assert result.is_clear
 
     def test_alarm_clears_is_clear(self):
         state = _make_state(dP_col=0.31)
-        result = evaluate_safety(state, _default_u())
+        result = evaluate_safety(state, _DEFAULT_U)
         assert not result.is_clear
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"dP_esd": LIMITS.dP_alarm},
+            {"dP_interlock": LIMITS.dP_esd},
+            {"T_top_esd": LIMITS.T_top_alarm},
+            {"L_drum_esd": LIMITS.L_drum_alarm},
+        ],
+    )
+    def test_import_rejects_unnested_limits(self, monkeypatch, overrides):
+        """The fast path and dp_tier need alarm limits inside ESD ones."""
+        monkeypatch.setattr(constants, "LIMITS", replace(LIMITS, **overrides))
+        # Execute a private copy of the module so the real one is untouched
+        spec = importlib.util.spec_from_file_location(
+            "_safety_system_check", safety_system.__file__
+        )
+        with pytest.raises(ValueError):
+            spec.loader.exec_module(importlib.util.module_from_spec(spec))
+
+    def test_dp_tier_boundaries(self):
+        assert dp_tier(0.08) == 0
+        assert dp_tier(LIMITS.dP_alarm) == 0
+        assert dp_tier(0.31) == 1
+        assert dp_tier(0.335) == 2
+        assert dp_tier(LIMITS.dP_esd) == 2
+        assert dp_tier(0.35) == 3
+
+
+class TestSafetyBatch:
+    _CASES = (
+        {},
+        {"dP_col": 0.31, "xB_sd": 0.998, "L_Bot": 0.08},
+        {"dP_col": 0.335},
+        {"dP_col": 0.35},
+        {"T_top": 104.0},
+        {"L_Drum": 0.04},
+        {"T_top": 101.0, "L_Drum": 0.08},
+    )
+
+    def test_batch_matches_scalar(self):
+        states = [_make_state(**case) for case in self._CASES]
+        batch = evaluate_safety_batch(np.array([astuple(s) for s in states]))
+        for i, state in enumerate(states):
+            result = evaluate_safety(state, _DEFAULT_U)
+            assert batch.alarm_mask[i] == result.alarm_mask
+            assert batch.interlock_active[i] == result.interlock_active
+            assert batch.esd_triggered[i] == result.esd_triggered
@@ -1,5 +1,7 @@
 """Tests for scenario library."""
 
+import pytest
+
 from src.scenarios.library import SCENARIO_LIBRARY, get_scenario, Scenario
 
 
@@ -34,6 +36,13 @@ class TestScenarioLibrary:
         assert "Fouling_Cond" in d
         assert "Fouling_Reb" in d
 
+    def test_to_dict_is_cached_and_read_only(self):
+        s = get_scenario("Normal Operations")
+        d = s.to_dict()
+        assert s.to_dict() is d
+        with pytest.raises(TypeError):
+            d["F_feed"] = 0.0
+
     def test_has_custom_scenario(self):
         assert get_scenario("Custom") is not None
 
@@ -1,114 +1,172 @@
 """Tests for the scoring system."""
 
+import math
+from dataclasses import replace
+
+import numpy as np
 import pytest
 
 from src.models.plant_state import PlantState
 from src.models.constants import STEADY_STATE, LIMITS
-from src.safety.safety_system import SafetyResult
-from src.scoring.tracker import ScoreTracker, TurnScore
+from src.safety.safety_system import SafetyResult, evaluate_safety, evaluate_safety_batch
+from src.scoring.tracker import ScoreTracker, TurnScore, score_components_batch
+
+
+_BASE = PlantState(**STEADY_STATE)
 
 
 def _make_state(**overrides) -> PlantState:
-    d = {**STEADY_STATE, **overrides}
-    return PlantState.from_dict(d)
+    return replace(_BASE, **overrides) if overrides else _BASE
+
+
+# Shared safety outcomes; score_turn only reads its SafetyResult
+_SAFETY_OK = SafetyResult()
+_SAFETY_ESD = SafetyResult(esd_triggered=True, esd_reason="test")
+_SAFETY_INTERLOCK = SafetyResult(interlock_active=True, interlock_reason="test")
+_SAFETY_ALARMS = SafetyResult(alarms=["alarm1", "alarm2"])
+
+
+@pytest.fixture
+def scorer() -> ScoreTracker:
+    # Function-scoped: the tracker accumulates history and counters
+    return ScoreTracker()
 
 
 class TestTurnScoring:
-    def test_perfect_state_high_score(self):
+    def test_perfect_state_high_score(self, scorer):
         """Near-perfect state should score high."""
-        scorer = ScoreTracker()
         state = _make_state(xB_sd=0.9990, dP_col=0.01, L_Drum=0.50, L_Bot=0.50)
-        safety = SafetyResult()
-        score = scorer.score_turn(1, state, safety)
+        score = scorer.score_turn(1, state, _SAFETY_OK)
         assert score.total >= 70
 
-    def test_off_spec_reduces_purity_score(self):
-        scorer = ScoreTracker()
+    def test_off_spec_reduces_purity_score(self, scorer):
         state_good = _make_state(xB_sd=0.9990)
         state_bad = _make_state(xB_sd=0.990)
-        safety = SafetyResult()
-        s1 = scorer.score_turn(1, state_good, safety)
-        s2 = scorer.score_turn(2, state_bad, safety)
+        s1 = scorer.score_turn(1, state_good, _SAFETY_OK)
+        s2 = scorer.score_turn(2, state_bad, _SAFETY_OK)
         assert s1.purity_score > s2.purity_score
 
-    def test_high_dP_reduces_pressure_score(self):
-        scorer = ScoreTracker()
+    def test_high_dP_reduces_pressure_score(self, scorer):
         state_good = _make_state(dP_col=0.05)
         state_bad = _make_state(dP_col=0.28)
-        safety = SafetyResult()
-        s1 = scorer.score_turn(1, state_good, safety)
-        s2 = scorer.score_turn(2, state_bad, safety)
+        s1 = scorer.score_turn(1, state_good, _SAFETY_OK)
+        s2 = scorer.score_turn(2, state_bad, _SAFETY_OK)
         assert s1.pressure_score > s2.pressure_score
 
-    def test_esd_penalty(self):
-        scorer = ScoreTracker()
-        state = _make_state()
-        safety = SafetyResult(esd_triggered=True, esd_reason="test")
-        score = scorer.score_turn(1, state, safety)
-        assert score.safety_penalty == -20.0
-        assert scorer.esd_count == 1
-
-    def test_interlock_penalty(self):
-        scorer = ScoreTracker()
-        state = _make_state()
-        safety = SafetyResult(interlock_active=True, interlock_reason="test")
-        score = scorer.score_turn(1, state, safety)
-        assert score.safety_penalty == -10.0
-        assert scorer.interlock_count == 1
+    @pytest.mark.parametrize(
+        "safety, penalty, counter, count",
+        [
+            (_SAFETY_ESD, -20.0, "esd_count", 1),
+            (_SAFETY_INTERLOCK, -10.0, "interlock_count", 1),
+            (_SAFETY_ALARMS, -6.0, "alarm_count", 2),
+        ],
+    )
+    def test_safety_penalty(self, scorer, safety, penalty, counter, count):
+        score = scorer.score_turn(1, _BASE, safety)
+        assert score.safety_penalty == penalty
+        assert getattr(scorer, counter) == count
+
+    def test_score_never_negative(self, scorer):
+        state = _make_state(xB_sd=0.80, dP_col=0.35)
+        score = scorer.score_turn(1, state, _SAFETY_ESD)
+        assert score.total >= 0.0
 
-    def test_alarm_penalty(self):
-        scorer = ScoreTracker()
-        state = _make_state()
-        safety = SafetyResult(alarms=["alarm1", "alarm2"])
-        score = scorer.score_turn(1, state, safety)
-        assert score.safety_penalty == -6.0
-        assert scorer.alarm_count == 2
 
-    def test_score_never_negative(self):
+class TestScoreComponentsBatch:
+    def test_batch_matches_score_turn(self):
+        states = [
+            _BASE,
+            _make_state(xB_sd=0.9990, dP_col=0.01, L_Drum=0.50, L_Bot=0.50),
+            _make_state(xB_sd=0.990, dP_col=0.28, L_Drum=0.2, L_Bot=0.9),
+            _make_state(xB_sd=0.80, dP_col=0.35),
+        ]
+        batch = score_components_batch(np.array([s.to_tuple() for s in states]))
+        assert batch.shape == (len(states), 3)
         scorer = ScoreTracker()
-        state = _make_state(xB_sd=0.80, dP_col=0.35)
-        safety = SafetyResult(esd_triggered=True, esd_reason="test")
-        score = scorer.score_turn(1, state, safety)
-        assert score.total >= 0.0
+        for row, state in zip(batch, states):
+            score = scorer.score_turn(1, state, _SAFETY_OK)
+            assert np.round(row, 1) == pytest.approx(
+                [score.purity_score, score.pressure_score, score.level_score]
+            )
+
+
+class TestScoreTurnsBatch:
+    def test_batch_matches_sequential_scoring(self):
+        u = {"SP_F_Reflux": 25.0, "SP_F_Reboil": 1.2, "SP_F_ToTol": 55.0}
+        states = [
+            _make_state(xB_sd=0.9990, dP_col=0.01, L_Drum=0.50, L_Bot=0.50),
+            _make_state(dP_col=0.31, L_Bot=0.08),
+            _make_state(dP_col=0.335),
+            _make_state(dP_col=0.35),
+        ]
+        arr = np.array([s.to_tuple() for s in states])
+
+        batch = ScoreTracker()
+        totals = batch.score_turns_batch(1, arr, evaluate_safety_batch(arr))
+
+        seq = ScoreTracker()
+        for turn, state in enumerate(states, start=1):
+            seq.score_turn(turn, state, evaluate_safety(state, u))
+
+        assert batch.history == seq.history
+        assert totals.tolist() == [s.total for s in seq.history]
+        assert batch.summary() == seq.summary()
+
+    def test_alarm_free_penalty_is_positive_zero(self):
+        states = [_make_state(xB_sd=0.9990), _make_state(xB_sd=0.9990, L_Bot=0.50)]
+        arr = np.array([s.to_tuple() for s in states])
+        tracker = ScoreTracker()
+        tracker.score_turns_batch(1, arr, evaluate_safety_batch(arr))
+        for score in tracker.history:
+            assert score.safety_penalty == 0.0
+            assert math.copysign(1.0, score.safety_penalty) == 1.0
+            assert f"{score.safety_penalty:+.0f}" == "+0"
 
 
 class TestScoreTracker:
-    def test_average_empty(self):
-        scorer = ScoreTracker()
+    def test_average_empty(self, scorer):
         assert scorer.average_score == 0.0
 
-    def test_average_after_turns(self):
-        scorer = ScoreTracker()
-        state = _make_state()
-        safety = SafetyResult()
-        scorer.score_turn(1, state, safety)
-        scorer.score_turn(2, state, safety)
+    def test_average_after_turns(self, scorer):
+        scorer.score_turn(1, _BASE, _SAFETY_OK)
+        scorer.score_turn(2, _BASE, _SAFETY_OK)
         assert scorer.average_score > 0.0
 
-    def test_summary(self):
-        scorer = ScoreTracker()
-        state = _make_state()
-        safety = SafetyResult()
-        scorer.score_turn(1, state, safety)
+    def test_reset_clears_running_average(self, scorer):
+        scorer.score_turn(1, _BASE, _SAFETY_OK)
+        scorer.reset()
+        assert scorer.average_score == 0.0
+        scorer.score_turn(1, _make_state(xB_sd=0.9990), _SAFETY_OK)
+        assert scorer.average_score == scorer.history[0].total
+
+    def test_summary(self, scorer):
+        scorer.score_turn(1, _BASE, _SAFETY_OK)
         s = scorer.summary()
         assert s["turns"] == 1
         assert "grade" in s
         assert "esd_trips" in s
 
-    def test_grade_mapping(self):
-        scorer = ScoreTracker()
+    def test_grade_mapping(self, scorer):
         # Near-perfect state -> high grade
         state = _make_state(xB_sd=0.9990, dP_col=0.01, L_Drum=0.50, L_Bot=0.50)
-        safety = SafetyResult()
-        scorer.score_turn(1, state, safety)
+        scorer.score_turn(1, state, _SAFETY_OK)
         assert scorer.overall_grade in ("A", "B")
 
 
 class TestTurnScoreGrade:
-    def test_grade_a(self):
-        score = TurnScore(turn=1, purity_score=38, pressure_score=19, level_score=18, safety_penalty=0, total=95)
-        assert score.grade == "A"
-
-    def test_grade_f(self):
-        score = TurnScore(turn=1, purity_score=10, pressure_score=5, level_score=5, safety_penalty=-20, total=10)
-        assert score.grade == "F"
+    @pytest.mark.parametrize(
+        "total, penalty, expected",
+        [
+            (95, 0, "A"),
+            (10, -20, "F"),
+            # Each band's lower edge is inclusive
+            (90, 0, "A"),
+            (80, 0, "B"),
+            (70, 0, "C"),
+            (60, 0, "D"),
+            (59.9, 0, "F"),
+        ],
+    )
+    def test_grade(self, total, penalty, expected):
+        score = TurnScore(turn=1, purity_score=0, pressure_score=0, level_score=0, safety_penalty=penalty, total=total)
+        assert score.grade == expected